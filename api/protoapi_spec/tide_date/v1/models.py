@@ -5,9 +5,17 @@ Tide Date API v1 - Pydantic Models
 对应 api.proto 中定义的消息结构
 """
 
-from typing import Optional
+import sys
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# 字段别名统一驻留，各模型共享同一字符串对象，
+# 校验时的 dict 查找可走指针比较的快路径
+REQUEST_ID_ALIAS = sys.intern("RequestId")
+DATA_ALIAS = sys.intern("Data")
+DATE_ALIAS = sys.intern("Date")
+ERROR_ALIAS = sys.intern("Error")
 
 
 class Error(BaseModel):
@@ -18,42 +26,44 @@ class Error(BaseModel):
     reason: str = Field(default="", description="错误原因")
 
 
+# 各消息共用的字段类型，FieldInfo 只构建一次
+RequestId = Annotated[str, Field(alias=REQUEST_ID_ALIAS, description="请求ID")]
+Date = Annotated[str, Field(alias=DATE_ALIAS, description="当前时间")]
+ErrorField = Annotated[Optional[Error], Field(alias=ERROR_ALIAS, description="错误信息")]
+
+
 class NowRequest(BaseModel):
     """Now 请求"""
 
-    request_id: str = Field(default="", alias="RequestId", description="请求ID")
-    data: Optional[bytes] = Field(default=None, alias="Data", description="数据")
+    request_id: RequestId = ""
+    data: Optional[bytes] = Field(default=None, alias=DATA_ALIAS, description="数据")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class NowResponse(BaseModel):
     """Now 响应"""
 
-    request_id: str = Field(default="", alias="RequestId", description="请求ID")
-    date: str = Field(default="", alias="Date", description="当前时间")
-    error: Optional[Error] = Field(default=None, alias="Error", description="错误信息")
+    request_id: RequestId = ""
+    date: Date = ""
+    error: ErrorField = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class NowErrorRequest(BaseModel):
     """NowError 请求"""
 
-    request_id: str = Field(default="", alias="RequestId", description="请求ID")
+    request_id: RequestId = ""
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class NowErrorResponse(BaseModel):
     """NowError 响应"""
 
-    request_id: str = Field(default="", alias="RequestId", description="请求ID")
-    date: str = Field(default="", alias="Date", description="当前时间")
-    error: Optional[Error] = Field(default=None, alias="Error", description="错误信息")
+    request_id: RequestId = ""
+    date: Date = ""
+    error: ErrorField = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
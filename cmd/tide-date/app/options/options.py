@@ -8,20 +8,94 @@ Licensed under the Apache License, Version 2.0 (the "License");
 Server Run Options - Similar to sea's options.go
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import os
+import pickle
+import signal
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
-from tide.config import ConfigLoader
-from tide.plugins.monitor import MonitorConfig
+from tide import __version__
+from tide.plugins.monitor import MonitorConfig, install_monitor
+from tide.plugins.webserver import create_web_server, request_shutdown
+
+from .plugin_config import install_config
+from .plugin_web_handler import install_web_handler
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# With TIDE_CONFIG_CACHE=1, parsed configs are cached here so restarts can
+# skip YAML parsing. Off by default: the cache is unpickled on start, so only
+# enable it when the cache directory is private to the service user.
+_CONFIG_CACHE_ENABLED = os.environ.get("TIDE_CONFIG_CACHE") == "1"
+_CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tide-date"
+)
+
+
+def _load_yaml(config_path: Path) -> Dict[str, Any]:
+    """Parse a YAML config file."""
+    # libyaml consumes bytes natively, skip the text decode pass
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
 
-@dataclass
+
+def _load_yaml_cached(config_path: Path) -> Dict[str, Any]:
+    """Load a YAML config file, reusing a pickled copy when unchanged.
+
+    The cache entry is keyed by the file's absolute path, mtime and size,
+    so any edit to the config invalidates it.
+    """
+    stat = config_path.stat()
+    prefix = hashlib.md5(str(config_path.resolve()).encode("utf-8")).hexdigest()
+    cache_file = _CONFIG_CACHE_DIR / (
+        f"{config_path.name}.{prefix}.{stat.st_mtime_ns}-{stat.st_size}.pkl"
+    )
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+    data = _load_yaml(config_path)
+
+    try:
+        _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _CONFIG_CACHE_DIR.glob(f"{config_path.name}.{prefix}.*.pkl"):
+            stale.unlink()
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Failed to write config cache {cache_file}: {e}")
+
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of a config section, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@dataclass(**_SLOTS)
 class WebConfig:
     """Web server configuration."""
 
@@ -33,7 +107,7 @@ class WebConfig:
     qps_limit: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LogConfig:
     """Log configuration."""
 
@@ -46,9 +120,11 @@ class LogConfig:
     rotate_size: int = 104857600
     report_caller: bool = True
     redirect: str = "stdout"
+    # Process-wide: also drops thread/process info from other libraries' logs
+    lean_records: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DatabaseConfig:
     """Database configuration."""
 
@@ -56,7 +132,16 @@ class DatabaseConfig:
     redis: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+def _make_section(cls, data: Dict[str, Any]):
+    """Build a config section from the parsed YAML mapping.
+
+    Only keys present in the mapping are passed, so missing fields use the
+    dataclass defaults (dict defaults come from a fresh default_factory).
+    """
+    return cls(**{name: data[name] for name in _field_names(cls) if name in data})
+
+
+@dataclass(**_SLOTS)
 class ServerRunOptions:
     """Server run options.
 
@@ -69,17 +154,39 @@ class ServerRunOptions:
     log_config: Optional[LogConfig] = None
     database_config: Optional[DatabaseConfig] = None
     monitor_config: Optional[MonitorConfig] = None
+    # When False, the config is loaded later by load_config_async()
+    load_on_init: bool = True
 
     def __post_init__(self):
         """Load configuration from file."""
-        self._load_config()
+        if self.load_on_init:
+            self._load_config()
 
     def _load_config(self):
         """Load configuration from YAML file."""
+        self._apply_config(self._read_config())
+
+    async def load_config_async(self):
+        """Load configuration from YAML file in a worker thread.
+
+        Keeps the file read and parse off the event loop.
+        """
+        self._apply_config(await asyncio.to_thread(self._read_config))
+
+    def _read_config(self) -> Optional[Dict[str, Any]]:
+        """Read the YAML file, or return None if it does not exist."""
         config_path = Path(self.config_file)
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                self.config = yaml.safe_load(f) or {}
+        if not config_path.exists():
+            logger.warning(f"Config file not found: {config_path}")
+            return None
+        if _CONFIG_CACHE_ENABLED:
+            return _load_yaml_cached(config_path)
+        return _load_yaml(config_path)
+
+    def _apply_config(self, data: Optional[Dict[str, Any]]):
+        """Parse sub-configs from the loaded data."""
+        if data is not None:
+            self.config = data
 
             # Parse sub-configs
             self.web_config = self._parse_web_config(self.config.get("web", {}))
@@ -91,43 +198,22 @@ class ServerRunOptions:
                 self.config.get("monitor", {})
             )
         else:
-            logger.warning(f"Config file not found: {config_path}")
-            self.web_config = WebConfig()
-            self.log_config = LogConfig()
-            self.database_config = DatabaseConfig()
+            self.web_config = _make_section(WebConfig, {})
+            self.log_config = _make_section(LogConfig, {})
+            self.database_config = _make_section(DatabaseConfig, {})
             self.monitor_config = MonitorConfig()
 
     def _parse_web_config(self, data: Dict[str, Any]) -> WebConfig:
         """Parse web configuration."""
-        return WebConfig(
-            bind_address=data.get("bind_address", {"port": 10001}),
-            grpc=data.get("grpc", {}),
-            http=data.get("http", {}),
-            debug=data.get("debug", {}),
-            open_telemetry=data.get("open_telemetry", {}),
-            qps_limit=data.get("qps_limit", {}),
-        )
+        return _make_section(WebConfig, data)
 
     def _parse_log_config(self, data: Dict[str, Any]) -> LogConfig:
         """Parse log configuration."""
-        return LogConfig(
-            formatter=data.get("formatter", "glog"),
-            level=data.get("level", "debug"),
-            filepath=data.get("filepath", "./log"),
-            max_age=data.get("max_age", "604800s"),
-            max_count=data.get("max_count", 200),
-            rotate_interval=data.get("rotate_interval", "3600s"),
-            rotate_size=data.get("rotate_size", 104857600),
-            report_caller=data.get("report_caller", True),
-            redirect=data.get("redirect", "stdout"),
-        )
+        return _make_section(LogConfig, data)
 
     def _parse_database_config(self, data: Dict[str, Any]) -> DatabaseConfig:
         """Parse database configuration."""
-        return DatabaseConfig(
-            mysql=data.get("mysql", {}),
-            redis=data.get("redis", {}),
-        )
+        return _make_section(DatabaseConfig, data)
 
     def _parse_monitor_config(self, data: Dict[str, Any]) -> MonitorConfig:
         """Parse monitor configuration."""
@@ -150,6 +236,8 @@ class CompletedServerRunOptions:
 
     def __init__(self, options: ServerRunOptions):
         self._options = options
+        self._web_server = None
+        self._run_task: Optional[asyncio.Task] = None
 
     @property
     def options(self) -> ServerRunOptions:
@@ -161,10 +249,12 @@ class CompletedServerRunOptions:
 
         Similar to sea's Run method.
         """
-        from tide import __version__
-
         logger.info(f"Starting tide-date version {__version__}")
 
+        # Load config now if construction deferred it
+        if self._options.web_config is None:
+            await self._options.load_config_async()
+
         # Install plugins in order
         self._install_logs()
         self._install_config()
@@ -183,64 +273,120 @@ class CompletedServerRunOptions:
         # 安装监控插件
         await self._install_monitor(web_server)
 
+        # Pay first-request costs before accepting traffic
+        await self._warm_up(web_server)
+
+        # Shutdown signals are scoped to the loop that actually serves
+        self._web_server = web_server
+        self._install_signal_handlers()
+
         # Run the server
         # GenericWebServer.run() 是同步方法，使用 run_async() 进行异步运行
-        if hasattr(web_server, 'run_async'):
-            await web_server.run_async()
-        else:
-            # Fallback server
-            await web_server.run()
+        try:
+            if hasattr(web_server, 'run_async'):
+                await web_server.run_async()
+            else:
+                # Fallback server
+                await web_server.run()
+        except asyncio.CancelledError:
+            logger.info("Server stopped")
+
+    def _install_signal_handlers(self):
+        """Ask the web server to stop gracefully on SIGTERM/SIGINT."""
+        loop = asyncio.get_running_loop()
+        self._run_task = asyncio.current_task()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._on_signal, sig)
+
+    def _on_signal(self, sig):
+        """Handle a shutdown signal.
+
+        The serve task is not cancelled: run() returns once the web server
+        has drained its in-flight requests.
+        """
+        logger.info(f"Received exit signal {sig.name}...")
+        if not request_shutdown(self._web_server) and self._run_task is not None:
+            # Last resort for servers without a graceful stop
+            logger.warning("Web server has no graceful shutdown, cancelling run task")
+            self._run_task.cancel()
 
     def _install_logs(self):
         """Install logging configuration."""
+        # plugin_logs imports LogConfig from this module, keep it lazy
         from .plugin_logs import install_logs
 
         install_logs(self._options.log_config)
 
     def _install_config(self):
         """Install configuration to provider."""
-        from .plugin_config import install_config
-
         install_config(self._options.config)
 
     async def _create_web_server(self):
         """Create and configure web server."""
-        from tide.plugins.webserver import create_web_server
-
         return await create_web_server(self._options.web_config)
 
     async def _install_mysql(self):
         """Install MySQL if enabled."""
+        config = self._options.database_config.mysql
+        if not config or not config.get("enabled", False):
+            logger.debug("MySQL is disabled, skipping installation")
+            return
+
+        # Only import the plugin (and its SDK) when it is enabled
         from .plugin_mysql import install_mysql
 
-        await install_mysql(self._options.database_config.mysql)
+        await install_mysql(config)
 
     async def _install_redis(self):
         """Install Redis if enabled."""
+        config = self._options.database_config.redis
+        if not config or not config.get("enabled", False):
+            logger.debug("Redis is disabled, skipping installation")
+            return
+
         from .plugin_redis import install_redis
 
-        await install_redis(self._options.database_config.redis)
+        await install_redis(config)
 
     async def _install_opentelemetry(self, web_server):
         """Install OpenTelemetry if enabled."""
+        config = self._options.web_config.open_telemetry
+        if not config or not config.get("enabled", False):
+            logger.debug("OpenTelemetry is disabled, skipping installation")
+            return
+
         from .plugin_opentelemetry import install_opentelemetry
 
-        await install_opentelemetry(
-            self._options.web_config.open_telemetry,
-            web_server
-        )
+        await install_opentelemetry(config, web_server)
 
     def _install_web_handler(self, web_server):
         """Install web handlers.
 
         Similar to sea's installWebHandlerOrDie.
         """
-        from .plugin_web_handler import install_web_handler
-
         install_web_handler(web_server)
 
+    async def _warm_up(self, web_server):
+        """Send one in-process request through the app and discard it.
+
+        The first request pays for route setup, model validator warm-up
+        and first-span initialization; doing it here keeps that latency
+        off real traffic. Failures are logged and ignored.
+        """
+        app = getattr(web_server, "app", None)
+        if app is None:
+            return
+
+        try:
+            import httpx
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+                await client.post("/Now", json={"RequestId": "warmup"})
+            logger.debug("Warm-up request completed")
+        except Exception as e:
+            logger.debug(f"Warm-up request failed: {e}")
+
     async def _install_monitor(self, web_server):
         """安装监控插件。"""
-        from tide.plugins.monitor import install_monitor
-
         await install_monitor(self._options.monitor_config, web_server)
@@ -5,6 +5,7 @@ Plugin: Config - Similar to sea's plugin.config.go
 """
 
 import logging
+from types import MappingProxyType
 from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,7 @@ def install_config(config: Dict[str, Any]):
     from pkg.tide_date.provider import global_provider
 
     provider = global_provider()
-    provider.config = config
+    # Read-only view: installed config is shared process-wide and never mutated
+    provider.config = MappingProxyType(config)
 
     logger.info(f"Config installed: {list(config.keys())}")
@@ -4,75 +4,155 @@
 Plugin: Logs - Similar to sea's plugin.logs.go
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from .options import LogConfig
 
 logger = logging.getLogger(__name__)
 
+# Google log format
+_GLOG_FMT = "%(levelname)s %(asctime)s %(filename)s:%(lineno)d] %(message)s"
+_GLOG_FMT_NO_CALLER = "%(levelname)s %(asctime)s] %(message)s"
+_GLOG_DATEFMT = "%m%d %H:%M:%S"
+_TEXT_FMT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Process-wide record flags saved before lean_records first changed them
+_saved_record_flags: Optional[Tuple[Optional[str], bool, bool, bool]] = None
+
+# Config level name -> logging level
+_LEVEL_MAP = {
+    sys.intern("debug"): logging.DEBUG,
+    sys.intern("info"): logging.INFO,
+    sys.intern("warn"): logging.WARNING,
+    sys.intern("warning"): logging.WARNING,
+    sys.intern("error"): logging.ERROR,
+    sys.intern("fatal"): logging.CRITICAL,
+}
+
+# Background listener draining records to the console or file handler
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener():
+    """Flush and stop the background file log listener, if any."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _set_lean_records(enabled: bool, report_caller: bool):
+    """Toggle the logging module's process-wide LogRecord flags.
+
+    The flags apply to every logger in the process, including third-party
+    libraries, so they are only changed when lean_records is enabled and
+    restored when it is turned off. The caller frame walk (logging._srcfile)
+    is kept whenever report_caller is on.
+    """
+    global _saved_record_flags
+
+    if _saved_record_flags is None:
+        if not enabled:
+            return
+        _saved_record_flags = (
+            logging._srcfile,
+            logging.logThreads,
+            logging.logProcesses,
+            logging.logMultiprocessing,
+        )
+
+    srcfile, threads, processes, multiprocessing = _saved_record_flags
+    if enabled:
+        logging._srcfile = srcfile if report_caller else None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+    else:
+        logging._srcfile = srcfile
+        logging.logThreads = threads
+        logging.logProcesses = processes
+        logging.logMultiprocessing = multiprocessing
+        _saved_record_flags = None
+
 
 def install_logs(config: Optional[LogConfig]):
     """Install logging configuration.
 
     Similar to sea's installLogsOrDie.
     """
+    global _listener
+
     if config is None:
         config = LogConfig()
 
     # Set log level
-    level_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warn": logging.WARNING,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "fatal": logging.CRITICAL,
-    }
-    level = level_map.get(config.level.lower(), logging.DEBUG)
+    level = _LEVEL_MAP.get(config.level.lower(), logging.DEBUG)
 
     # Create formatter
     if config.formatter == "glog":
-        # Google log format
-        fmt = "%(levelname)s %(asctime)s %(filename)s:%(lineno)d] %(message)s"
-        datefmt = "%m%d %H:%M:%S"
+        fmt = _GLOG_FMT if config.report_caller else _GLOG_FMT_NO_CALLER
+        datefmt = _GLOG_DATEFMT
     else:
-        fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        datefmt = "%Y-%m-%d %H:%M:%S"
+        fmt = _TEXT_FMT
+        datefmt = _TEXT_DATEFMT
 
-    formatter = logging.Formatter(fmt=fmt, datefmt=datefmt)
+    # Formats are constants, skip re-validating them
+    formatter = logging.Formatter(fmt=fmt, datefmt=datefmt, style="%", validate=False)
+
+    # Opt-in: skip record attributes none of our formats use
+    _set_lean_records(config.lean_records, config.report_caller)
 
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
     # Clear existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
 
-    # Add handlers based on redirect config
+    # Pick the output handler based on redirect config
     if config.redirect == "stdout" or config.redirect == "":
         # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handler = logging.StreamHandler(sys.stdout)
     else:
         # File handler
         log_path = Path(config.filepath)
         log_path.mkdir(parents=True, exist_ok=True)
         log_file = log_path / "tide-date.log"
 
-        # Rotating file handler
-        file_handler = RotatingFileHandler(
+        # Rotating file handler, opened lazily on the first record
+        handler = RotatingFileHandler(
             log_file,
             maxBytes=config.rotate_size,
             backupCount=config.max_count,
+            delay=True,
         )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+    handler.setLevel(level)
+    handler.setFormatter(formatter)
+
+    # The handler runs on a listener thread so formatting, rollover stats
+    # and stdout/file writes stay off the event loop; callers only enqueue.
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    root_logger.addHandler(queue_handler)
 
     logger.info(f"Logging initialized with level: {config.level}")
+
+
+atexit.register(_stop_listener)
@@ -6,6 +6,9 @@ Plugin: OpenTelemetry - Similar to sea's plugin.opentelemetry.go
 使用 peek 库的 OpenTelemetryService 来实现，与 Go 版本的 sea 保持一致。
 """
 
+import copy
+import functools
+import json
 import logging
 from typing import Any, Dict, Optional
 
@@ -54,6 +57,24 @@ def _convert_config_to_peek_format(config: Dict[str, Any]) -> Dict[str, Any]:
     if not config:
         return {}
 
+    # 转换结果只取决于配置内容：以规范化 JSON 为键缓存，配置不变（如热加载）时直接复用。
+    # 含有无法编码为 JSON 的值或无法排序的键时不走缓存，直接转换
+    try:
+        config_key = json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return _build_peek_config(config)
+    # 缓存的结果是共享实例，返回副本，调用方可以放心修改
+    return copy.deepcopy(_convert_cached(config_key))
+
+
+@functools.lru_cache(maxsize=8)
+def _convert_cached(config_key: str) -> Dict[str, Any]:
+    """按规范化 JSON 缓存的配置转换"""
+    return _build_peek_config(json.loads(config_key))
+
+
+def _build_peek_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """构建 peek 格式配置"""
     # 解析 exporter 类型
     trace_exporter_type = config.get("otel_trace_exporter_type", "trace_none")
     metric_exporter_type = config.get("otel_metric_exporter_type", "metric_none")
@@ -217,6 +238,16 @@ async def install_opentelemetry(
         logger.debug("OpenTelemetry is disabled, skipping installation")
         return
 
+    # 将 tide 配置格式转换为 peek 格式
+    peek_config = _convert_config_to_peek_format(config)
+    tracer_enabled = peek_config["tracer"]["enabled"]
+    metric_enabled = peek_config["metric"]["enabled"]
+
+    # exporter 均为 none 时无需加载 OpenTelemetry SDK
+    if not tracer_enabled and not metric_enabled:
+        logger.info("OpenTelemetry exporters are all none, skipping installation")
+        return
+
     try:
         from peek.opentelemetry import OpenTelemetryService
     except ImportError:
@@ -227,9 +258,6 @@ async def install_opentelemetry(
         return
 
     try:
-        # 将 tide 配置格式转换为 peek 格式
-        peek_config = _convert_config_to_peek_format(config)
-
         logger.debug(f"Converted peek config: {peek_config}")
 
         # 使用 peek 的 OpenTelemetryService
@@ -242,7 +270,11 @@ async def install_opentelemetry(
         # ========================================
         # Instrument FastAPI (禁用 http send/receive 子 Span)
         # ========================================
-        if web_server is not None:
+        # 仅在启用 tracer 时加载 FastAPIInstrumentor
+        # instrument_app 会在 app 上打标记，已插桩则跳过，避免重复产生 span
+        if tracer_enabled and web_server is not None and not getattr(
+            web_server.app, "_is_instrumented_by_opentelemetry", False
+        ):
             try:
                 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
@@ -259,10 +291,6 @@ async def install_opentelemetry(
                 logger.debug("FastAPI instrumentation not available")
             except Exception as e:
                 logger.warning(f"Failed to instrument FastAPI: {e}")
-            except ImportError:
-                logger.debug("FastAPI instrumentation not available")
-            except Exception as e:
-                logger.warning(f"Failed to instrument FastAPI: {e}")
 
         logger.info(
             "OpenTelemetry installed successfully via peek: "
@@ -6,12 +6,13 @@ Licensed under the Apache License, Version 2.0 (the "License");
 ...
 """
 
-import asyncio
 from pathlib import Path
 from typing import Optional
 
 import click
 
+from tide.app import run_event_loop
+
 from .options import ServerRunOptions
 
 
@@ -50,10 +51,11 @@ def run_command(config_file: str):
 
     Similar to sea's runCommand function.
     """
-    options = ServerRunOptions(config_file)
+    # The config file is read inside run(), off the event loop
+    options = ServerRunOptions(config_file, load_on_init=False)
 
     # Complete options (set defaults)
     completed_options = options.complete()
 
-    # Run the server
-    asyncio.run(completed_options.run())
+    # Run the server (on uvloop when it is installed)
+    run_event_loop(completed_options.run())
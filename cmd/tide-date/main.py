@@ -13,8 +13,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
-import signal
 import sys
 from pathlib import Path
 
@@ -23,21 +21,19 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))  # 添加项目根目录（包含 pkg, web）
 sys.path.insert(0, str(project_root / "src"))  # 添加 src 目录（包含 tide 框架）
 
-from app.server import new_command
+_VERSION_FLAGS = ("-v", "--version")
 
 
 def main():
     """Main entry point."""
-    # Setup signal handling
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # Answer --version without importing the CLI and server dependencies
+    if any(arg in _VERSION_FLAGS for arg in sys.argv[1:]):
+        from tide import __version__
 
-    # Handle shutdown signals
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(
-            sig,
-            lambda s=sig: asyncio.create_task(shutdown(s, loop))
-        )
+        print(f"tide-date version {__version__}")
+        return
+
+    from app.server import new_command
 
     try:
         command = new_command()
@@ -49,15 +45,5 @@ def main():
         sys.exit(1)
 
 
-async def shutdown(sig, loop):
-    """Cleanup tasks tied to the service's shutdown."""
-    print(f"Received exit signal {sig.name}...")
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-    for task in tasks:
-        task.cancel()
-    await asyncio.gather(*tasks, return_exceptions=True)
-    loop.stop()
-
-
 if __name__ == "__main__":
     main()
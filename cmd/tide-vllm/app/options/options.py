@@ -8,17 +8,80 @@ Licensed under the Apache License, Version 2.0 (the "License");
 Server Run Options - vLLM 服务配置选项
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import os
+import pickle
+import signal
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 设置 TIDE_CONFIG_CACHE=1 后缓存解析结果，进程重启时可跳过 YAML 解析
+_CONFIG_CACHE_ENABLED = os.environ.get("TIDE_CONFIG_CACHE") == "1"
+_CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tide-vllm"
+)
+
+
+def _load_yaml(config_path: Path) -> Dict[str, Any]:
+    """解析 YAML 配置文件。"""
+    # 只在真正解析时导入 yaml；命中 pickle 缓存或 --version 时无需加载
+    import yaml
+
+    # 优先使用 libyaml 实现的 C 加载器，不可用时回退到纯 Python 版本
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # libyaml 原生处理 UTF-8，以二进制读取省去文本解码
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
 
-@dataclass
+def _load_yaml_cached(config_path: Path) -> Dict[str, Any]:
+    """加载 YAML 配置文件，文件未变化时复用 pickle 缓存。
+
+    缓存以文件绝对路径、mtime 和大小为键，配置文件修改后自动失效。
+    """
+    stat = config_path.stat()
+    prefix = hashlib.md5(str(config_path.resolve()).encode("utf-8")).hexdigest()
+    cache_file = _CONFIG_CACHE_DIR / (
+        f"{config_path.name}.{prefix}.{stat.st_mtime_ns}-{stat.st_size}.pkl"
+    )
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"忽略无法读取的配置缓存 {cache_file}: {e}")
+
+    data = _load_yaml(config_path)
+
+    try:
+        _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _CONFIG_CACHE_DIR.glob(f"{config_path.name}.{prefix}.*.pkl"):
+            stale.unlink()
+        # 先写临时文件再原子替换，避免并发启动读到半个文件
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"写入配置缓存失败 {cache_file}: {e}")
+
+    return data
+
+
+@dataclass(**_SLOTS)
 class WebConfig:
     """Web 服务器配置。"""
 
@@ -30,7 +93,7 @@ class WebConfig:
     qps_limit: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class LogConfig:
     """日志配置。"""
 
@@ -45,7 +108,7 @@ class LogConfig:
     redirect: str = "stdout"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class VLLMConfig:
     """vLLM 服务配置。"""
     
@@ -70,9 +133,16 @@ class VLLMConfig:
     # 请求超时配置
     timeout: int = 60
     
+    # 同时发往 vLLM 的最大请求数
+    max_concurrency: int = 64
+    
+    # temperature=0 请求的响应缓存条目数，0 表示关闭（缓存不过期，换模型后需重启）
+    response_cache_size: int = 0
+    
     # vLLM server 启动参数（仅当 auto_start=True 时有效）
     gpu_memory_utilization: float = 0.9      # GPU 显存使用率
     tensor_parallel_size: int = 1            # 张量并行大小（多 GPU）
+    distributed_executor_backend: str = ""   # 分布式执行后端: mp, ray；为空时由 vLLM 决定
     max_num_seqs: int = 256                  # 最大并发序列数
     max_num_batched_tokens: int = 8192       # 最大批处理 token 数
     max_model_len: int = 4096                # 模型最大上下文长度
@@ -82,7 +152,44 @@ class VLLMConfig:
     enable_chunked_prefill: bool = True      # 启用分块预填充
 
 
-@dataclass
+def _parse_section(cls, data: Dict[str, Any]):
+    """按 dataclass 字段从配置字典构建配置对象。
+
+    只传入配置中出现的字段，缺省值统一由 dataclass 声明提供。
+    """
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+# 只读配置的默认实例，全局共享
+_DEFAULT_LOG_CONFIG = LogConfig()
+_DEFAULT_VLLM_CONFIG = VLLMConfig()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_frozen_section_cached(cls, items: tuple):
+    """按配置内容缓存只读配置对象，重复解析（如热加载）时直接复用。
+
+    items 为 (键, 值类型, 值) 三元组：True / 1 / 1.0 哈希相等，
+    键中带上类型才不会把不同类型的配置值解析成同一个对象。
+    """
+    return _parse_section(cls, {key: value for key, _, value in items})
+
+
+def _parse_frozen_section(cls, data: Dict[str, Any], default):
+    """解析只读（frozen）配置段。
+
+    配置为空时返回共享的默认实例；值不可哈希时退回普通解析。
+    """
+    if not data:
+        return default
+    try:
+        items = tuple((key, type(value), value) for key, value in sorted(data.items()))
+        return _parse_frozen_section_cached(cls, items)
+    except TypeError:
+        return _parse_section(cls, data)
+
+
+@dataclass(**_SLOTS)
 class ServerRunOptions:
     """服务器运行选项。"""
 
@@ -100,69 +207,32 @@ class ServerRunOptions:
         """从 YAML 文件加载配置。"""
         config_path = Path(self.config_file)
         if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                self.config = yaml.safe_load(f) or {}
+            if _CONFIG_CACHE_ENABLED:
+                self.config = _load_yaml_cached(config_path)
+            else:
+                self.config = _load_yaml(config_path)
 
             # 解析子配置
-            self.web_config = self._parse_web_config(self.config.get("web", {}))
-            self.log_config = self._parse_log_config(self.config.get("log", {}))
-            self.vllm_config = self._parse_vllm_config(self.config.get("vllm", {}))
+            self.web_config = self._parse_web_config(self.config.get("web") or {})
+            self.log_config = self._parse_log_config(self.config.get("log") or {})
+            self.vllm_config = self._parse_vllm_config(self.config.get("vllm") or {})
         else:
             logger.warning(f"配置文件未找到: {config_path}")
             self.web_config = WebConfig()
-            self.log_config = LogConfig()
-            self.vllm_config = VLLMConfig()
+            self.log_config = _DEFAULT_LOG_CONFIG
+            self.vllm_config = _DEFAULT_VLLM_CONFIG
 
     def _parse_web_config(self, data: Dict[str, Any]) -> WebConfig:
         """解析 Web 配置。"""
-        return WebConfig(
-            bind_address=data.get("bind_address", {"port": 10002}),
-            grpc=data.get("grpc", {}),
-            http=data.get("http", {}),
-            debug=data.get("debug", {}),
-            open_telemetry=data.get("open_telemetry", {}),
-            qps_limit=data.get("qps_limit", {}),
-        )
+        return _parse_section(WebConfig, data)
 
     def _parse_log_config(self, data: Dict[str, Any]) -> LogConfig:
         """解析日志配置。"""
-        return LogConfig(
-            formatter=data.get("formatter", "glog"),
-            level=data.get("level", "debug"),
-            filepath=data.get("filepath", "./log"),
-            max_age=data.get("max_age", "604800s"),
-            max_count=data.get("max_count", 200),
-            rotate_interval=data.get("rotate_interval", "3600s"),
-            rotate_size=data.get("rotate_size", 104857600),
-            report_caller=data.get("report_caller", True),
-            redirect=data.get("redirect", "stdout"),
-        )
+        return _parse_frozen_section(LogConfig, data, _DEFAULT_LOG_CONFIG)
 
     def _parse_vllm_config(self, data: Dict[str, Any]) -> VLLMConfig:
         """解析 vLLM 配置。"""
-        return VLLMConfig(
-            enabled=data.get("enabled", False),
-            host=data.get("host", "localhost"),
-            port=data.get("port", 8000),
-            api_key=data.get("api_key", ""),
-            auto_start=data.get("auto_start", False),
-            model_name=data.get("model_name", "Qwen/Qwen2.5-7B-Instruct"),
-            model_path=data.get("model_path", "Qwen/Qwen2.5-7B-Instruct"),
-            max_tokens=data.get("max_tokens", 2048),
-            temperature=data.get("temperature", 0.7),
-            top_p=data.get("top_p", 0.9),
-            timeout=data.get("timeout", 60),
-            # vLLM server 启动参数
-            gpu_memory_utilization=data.get("gpu_memory_utilization", 0.9),
-            tensor_parallel_size=data.get("tensor_parallel_size", 1),
-            max_num_seqs=data.get("max_num_seqs", 256),
-            max_num_batched_tokens=data.get("max_num_batched_tokens", 8192),
-            max_model_len=data.get("max_model_len", 4096),
-            dtype=data.get("dtype", "auto"),
-            startup_timeout=data.get("startup_timeout", 600),
-            enable_prefix_caching=data.get("enable_prefix_caching", True),
-            enable_chunked_prefill=data.get("enable_chunked_prefill", True),
-        )
+        return _parse_frozen_section(VLLMConfig, data, _DEFAULT_VLLM_CONFIG)
 
     def complete(self) -> "CompletedServerRunOptions":
         """完成设置默认 ServerRunOptions。"""
@@ -177,6 +247,8 @@ class CompletedServerRunOptions:
 
     def __init__(self, options: ServerRunOptions):
         self._options = options
+        self._web_server = None
+        self._run_task: Optional[asyncio.Task] = None
 
     @property
     def options(self) -> ServerRunOptions:
@@ -202,11 +274,41 @@ class CompletedServerRunOptions:
         # 安装 Web 处理器
         self._install_web_handler(web_server)
 
-        # 运行服务器
-        if hasattr(web_server, 'run_async'):
-            await web_server.run_async()
-        else:
-            await web_server.run()
+        # 信号处理注册在实际运行服务的事件循环上
+        self._web_server = web_server
+        self._install_signal_handlers()
+
+        # 运行服务器，退出时在事件循环内优雅停止 vLLM server；
+        # shield 保证再次收到信号也不会中断 vLLM 的清理
+        try:
+            if hasattr(web_server, 'run_async'):
+                await web_server.run_async()
+            else:
+                await web_server.run()
+        except asyncio.CancelledError:
+            logger.info("服务已停止")
+        finally:
+            await asyncio.shield(self._uninstall_vllm())
+
+    def _install_signal_handlers(self):
+        """收到 SIGTERM/SIGINT 时请求 Web 服务器优雅停止。"""
+        loop = asyncio.get_running_loop()
+        self._run_task = asyncio.current_task()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._on_signal, sig)
+
+    def _on_signal(self, sig):
+        """处理退出信号。
+
+        不取消运行服务的任务：Web 服务器处理完进行中的请求后 run() 自然返回。
+        """
+        from tide.plugins.webserver import request_shutdown
+
+        logger.info(f"接收到退出信号 {sig.name}...")
+        if not request_shutdown(self._web_server) and self._run_task is not None:
+            # 无法优雅停止时才退回到取消运行任务
+            logger.warning("Web 服务器不支持优雅停止，直接取消运行任务")
+            self._run_task.cancel()
 
     def _install_logs(self):
         """安装日志配置。"""
@@ -232,8 +334,14 @@ class CompletedServerRunOptions:
 
         await install_vllm(self._options.vllm_config)
 
+    async def _uninstall_vllm(self):
+        """停止 vLLM server（如有）。"""
+        from .plugin_vllm import uninstall_vllm
+
+        await uninstall_vllm()
+
     def _install_web_handler(self, web_server):
         """安装 Web 处理器。"""
         from .plugin_web_handler import install_web_handler
 
-        install_web_handler(web_server)
\ No newline at end of file
+        install_web_handler(web_server, self._options.vllm_config)
\ No newline at end of file
@@ -16,6 +16,26 @@ from .options import LogConfig
 
 logger = logging.getLogger(__name__)
 
+# 配置中的级别名 -> logging 级别
+_LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "fatal": logging.CRITICAL,
+}
+
+# 日志格式，模块加载时确定，安装时不再重复校验
+_GLOG_FMT = "[%(levelname).4s] [%(asctime)s] [%(process)d] [%(filename)s:%(lineno)d](%(funcName)s) %(message)s"
+_GLOG_DATEFMT = "%Y%m%d %H:%M:%S"
+_TEXT_FMT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# 输出到控制台 / 文件的 redirect 取值
+_STDOUT_REDIRECTS = frozenset(("stdout", "", "both"))
+_FILE_REDIRECTS = frozenset(("file", "both"))
+
 
 def install_logs(config: Optional[LogConfig]):
     """安装日志配置。
@@ -65,26 +85,18 @@ def _install_logs_fallback(config: LogConfig):
     from pathlib import Path
     
     # 设置日志级别
-    level_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warn": logging.WARNING,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "fatal": logging.CRITICAL,
-    }
-    level = level_map.get(config.level.lower(), logging.DEBUG)
+    level = _LEVEL_MAP.get(config.level.lower(), logging.DEBUG)
 
     # 创建格式化器
     if config.formatter == "glog":
         # Google log 格式
-        fmt = "[%(levelname).4s] [%(asctime)s] [%(process)d] [%(filename)s:%(lineno)d](%(funcName)s) %(message)s"
-        datefmt = "%Y%m%d %H:%M:%S"
+        fmt = _GLOG_FMT
+        datefmt = _GLOG_DATEFMT
     else:
-        fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        datefmt = "%Y-%m-%d %H:%M:%S"
+        fmt = _TEXT_FMT
+        datefmt = _TEXT_DATEFMT
 
-    formatter = logging.Formatter(fmt=fmt, datefmt=datefmt)
+    formatter = logging.Formatter(fmt=fmt, datefmt=datefmt, style="%", validate=False)
 
     # 获取根日志记录器
     root_logger = logging.getLogger()
@@ -96,14 +108,14 @@ def _install_logs_fallback(config: LogConfig):
     redirect = config.redirect.lower()
     
     # 添加控制台处理器
-    if redirect in ("stdout", "", "both"):
+    if redirect in _STDOUT_REDIRECTS:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
     
     # 添加文件处理器
-    if redirect in ("file", "both"):
+    if redirect in _FILE_REDIRECTS:
         log_path = Path(config.filepath)
         log_path.mkdir(parents=True, exist_ok=True)
         
@@ -112,11 +124,13 @@ def _install_logs_fallback(config: LogConfig):
         prog_name = Path(sys.argv[0]).stem if sys.argv else "app"
         log_file = log_path / f"{prog_name}.log"
 
-        # 轮转文件处理器
+        # 轮转文件处理器，首次写日志时才打开文件
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=config.rotate_size,
             backupCount=config.max_count,
+            encoding="utf-8",
+            delay=True,
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
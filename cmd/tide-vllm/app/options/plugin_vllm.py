@@ -12,17 +12,24 @@ import asyncio
 import atexit
 import logging
 import os
+import shutil
 import signal
 import subprocess
 import time
-from typing import Optional
-
-import httpx
+from typing import TYPE_CHECKING, Optional
 
 from .options import VLLMConfig
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
+# 就绪检查的退避间隔（秒）：从较短间隔开始，逐步放大到上限
+_READY_POLL_INITIAL_DELAY = 0.25
+_READY_POLL_MAX_DELAY = 5.0
+_READY_POLL_BACKOFF = 1.5
+
 
 class VLLMServerManager:
     """vLLM Server 进程管理器
@@ -38,16 +45,18 @@ class VLLMServerManager:
             config: vLLM 配置
         """
         self.config = config
-        self.process: Optional[subprocess.Popen] = None
-        self.log_task: Optional[asyncio.Task] = None
-        self._api_url = f"http://{config.host}:{config.port}/v1"
+        self.process: Optional[asyncio.subprocess.Process] = None
+        # 就绪检查与健康检查共用的 HTTP 客户端，首次使用时创建
+        self._http: Optional["httpx.AsyncClient"] = None
+        # /v1/models 响应中带引号的模型名，用于字节级快速判断
+        self._model_name_token = f'"{config.model_name}"'.encode("utf-8")
         
-        # 注册退出清理
+        # 正常退出时由 stop() 异步清理；atexit 仅作兜底，防止遗留占用 GPU 的进程
         atexit.register(self._cleanup_on_exit)
     
     def _cleanup_on_exit(self):
-        """程序退出时清理 vLLM server 进程"""
-        if self.process:
+        """程序退出时清理 vLLM server 进程（stop() 未执行时的兜底）"""
+        if self.process and self.process.returncode is None:
             logger.info("程序退出，停止 vLLM server...")
             try:
                 os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
@@ -60,31 +69,37 @@ class VLLMServerManager:
             logger.warning("vLLM server 已经在运行中")
             return
         
+        # 启动前校验张量并行大小，避免模型加载数分钟后才失败
+        await self._check_tensor_parallel_size()
+        
         # 构建 vLLM 启动命令
         cmd = self._build_vllm_command()
         
         logger.info(f"启动 vLLM server，命令: {' '.join(cmd)}")
         
         try:
+            # 先在 PATH 中查找 vllm，缺失时无需 fork 子进程即可报错；
+            # 找到后直接使用绝对路径，exec 时不再搜索 PATH
+            vllm_bin = shutil.which(cmd[0])
+            if vllm_bin is None:
+                raise FileNotFoundError(cmd[0])
+            cmd[0] = vllm_bin
+            
             # 使用环境变量
             env = os.environ.copy()
             
-            # 启动 vLLM 进程
-            self.process = subprocess.Popen(
-                cmd,
+            # 启动 vLLM 进程，stdout/stderr 直接继承父进程，
+            # vLLM 日志原样写入终端/journal，不经过 Python 转发
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd,
                 env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # 合并 stderr 到 stdout
-                universal_newlines=False,  # 使用 bytes 模式
-                bufsize=0,  # 无缓冲，bytes 模式下不支持行缓冲
+                stdout=None,
+                stderr=None,
                 preexec_fn=os.setsid,  # 创建新的进程组
             )
             
             logger.info(f"vLLM server 已启动，PID: {self.process.pid}")
             
-            # 启动后台任务记录 vLLM 输出
-            self.log_task = asyncio.create_task(self._log_vllm_output())
-            
         except FileNotFoundError:
             # vllm 命令不存在
             logger.error(
@@ -116,6 +131,12 @@ class VLLMServerManager:
             "--tensor-parallel-size", str(self.config.tensor_parallel_size),
         ]
         
+        if self.config.distributed_executor_backend:
+            cmd += [
+                "--distributed-executor-backend",
+                self.config.distributed_executor_backend,
+            ]
+        
         # 添加数据类型
         if self.config.dtype and self.config.dtype != "auto":
             cmd += ["--dtype", self.config.dtype]
@@ -129,38 +150,26 @@ class VLLMServerManager:
         
         return cmd
     
-    async def _log_vllm_output(self) -> None:
-        """记录 vLLM server 输出"""
-        if not self.process:
+    async def _check_tensor_parallel_size(self) -> None:
+        """校验张量并行大小不超过本机可见 GPU 数量
+        
+        使用 Ray 后端时 GPU 可来自多台机器，超出本机数量只记录警告
+        """
+        tensor_parallel_size = self.config.tensor_parallel_size
+        
+        # nvidia-smi 可能耗时数秒，放到线程中执行，不阻塞事件循环
+        gpu_count = await asyncio.to_thread(_visible_gpu_count)
+        if gpu_count is None or tensor_parallel_size <= gpu_count:
             return
         
-        try:
-            reader = asyncio.StreamReader()
-            protocol = asyncio.StreamReaderProtocol(reader)
-            transport, _ = await asyncio.get_event_loop().connect_read_pipe(
-                lambda: protocol, self.process.stdout
-            )
-            
-            try:
-                while self.process and self.process.poll() is None:
-                    try:
-                        line = await asyncio.wait_for(reader.readline(), timeout=1.0)
-                        if line:
-                            line_str = line.decode("utf-8", errors="replace").strip()
-                            logger.info(f"[vLLM] {line_str}")
-                        else:
-                            break
-                    except asyncio.TimeoutError:
-                        continue
-                    except asyncio.CancelledError:
-                        logger.debug("vLLM 日志读取任务已取消")
-                        break
-            finally:
-                transport.close()
-        except asyncio.CancelledError:
-            logger.debug("vLLM 日志读取任务已取消")
-        except Exception as e:
-            logger.error(f"读取 vLLM 输出时出错: {e}", exc_info=True)
+        message = (
+            f"tensor_parallel_size={tensor_parallel_size} "
+            f"超过本机可用 GPU 数量 {gpu_count}"
+        )
+        if self.config.distributed_executor_backend == "ray":
+            logger.warning(f"{message}，使用 Ray 后端，按多机部署继续启动")
+            return
+        raise RuntimeError(f"{message}，请调整配置")
     
     async def wait_for_ready(self, timeout: Optional[int] = None) -> None:
         """等待 vLLM server 就绪
@@ -174,12 +183,13 @@ class VLLMServerManager:
         logger.info(f"等待 vLLM server 就绪（超时: {timeout}s）...")
         logger.info("模型加载可能需要几分钟，请耐心等待...")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         last_log_time = start_time
+        delay = _READY_POLL_INITIAL_DELAY
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             # 检查进程是否还在运行
-            if self.process and self.process.poll() is not None:
+            if self.process and self.process.returncode is not None:
                 exit_code = self.process.returncode
                 logger.error(f"vLLM server 进程意外终止，退出码: {exit_code}")
                 raise RuntimeError(f"vLLM server 进程终止，退出码: {exit_code}")
@@ -187,14 +197,14 @@ class VLLMServerManager:
             # 检查服务是否就绪
             try:
                 if await self._check_server_ready():
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     logger.info(f"vLLM server 已就绪！耗时: {elapsed:.1f}s")
                     return
             except Exception as e:
                 logger.debug(f"vLLM server 就绪检查失败: {e}")
             
             # 每 30 秒记录一次进度
-            current_time = time.time()
+            current_time = time.monotonic()
             if current_time - last_log_time >= 30:
                 elapsed = current_time - start_time
                 remaining = timeout - elapsed
@@ -204,12 +214,30 @@ class VLLMServerManager:
                 )
                 last_log_time = current_time
             
-            await asyncio.sleep(2)
+            # 指数退避，且不越过超时时间
+            remaining = timeout - (current_time - start_time)
+            await asyncio.sleep(max(0.0, min(delay, remaining)))
+            delay = min(delay * _READY_POLL_BACKOFF, _READY_POLL_MAX_DELAY)
         
         # 超时
         logger.error(f"vLLM server 启动超时（{timeout}s）")
         raise TimeoutError(f"vLLM server 未能在 {timeout}s 内就绪")
     
+    def _get_http(self) -> "httpx.AsyncClient":
+        """获取检查用的 HTTP 客户端，首次调用时创建。
+
+        base_url 预先构建为 httpx.URL，请求只需传相对路径。
+        """
+        if self._http is None:
+            # 仅 auto_start 时才会走到这里，httpx 按需导入
+            import httpx
+
+            base_url = httpx.URL(
+                scheme="http", host=self.config.host, port=self.config.port, path="/v1/"
+            )
+            self._http = httpx.AsyncClient(base_url=base_url, timeout=5.0)
+        return self._http
+
     async def _check_server_ready(self) -> bool:
         """检查 vLLM server 是否就绪
         
@@ -219,21 +247,23 @@ class VLLMServerManager:
             bool: server 是否就绪
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self._api_url}/models")
-                if response.status_code == 200:
+            response = await self._get_http().get("/models")
+            if response.status_code == 200:
+                # 快路径：响应中出现该模型名即视为已加载，无需每次轮询都解码 JSON
+                if self._model_name_token in response.content:
+                    return True
+
+                if logger.isEnabledFor(logging.DEBUG):
                     data = response.json()
                     model_names = [model["id"] for model in data.get("data", [])]
-                    is_ready = self.config.model_name in model_names
-                    if not is_ready:
-                        logger.debug(
-                            f"模型 {self.config.model_name} 尚未就绪，"
-                            f"当前可用模型: {model_names}"
-                        )
-                    return is_ready
-                else:
-                    logger.debug(f"vLLM server 返回状态码: {response.status_code}")
-                    return False
+                    logger.debug(
+                        f"模型 {self.config.model_name} 尚未就绪，"
+                        f"当前可用模型: {model_names}"
+                    )
+                return False
+            else:
+                logger.debug(f"vLLM server 返回状态码: {response.status_code}")
+                return False
         except Exception as e:
             logger.debug(f"检查 vLLM server 就绪状态失败: {e}")
             return False
@@ -245,7 +275,7 @@ class VLLMServerManager:
             bool: server 是否健康
         """
         # 检查进程是否还在运行
-        if self.process and self.process.poll() is not None:
+        if self.process and self.process.returncode is not None:
             logger.warning(f"vLLM 进程已终止，退出码: {self.process.returncode}")
             return False
         
@@ -258,10 +288,10 @@ class VLLMServerManager:
         
         logger.info("正在停止 vLLM server...")
         
-        # 取消日志任务
-        if self.log_task:
-            self.log_task.cancel()
-            self.log_task = None
+        # 关闭检查用的 HTTP 客户端
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
         
         try:
             # 发送 SIGTERM 信号到进程组
@@ -269,13 +299,13 @@ class VLLMServerManager:
             
             # 等待优雅关闭
             try:
-                self.process.wait(timeout=10)
+                await asyncio.wait_for(self.process.wait(), timeout=10)
                 logger.info("vLLM server 已优雅停止")
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 # 强制终止
                 logger.warning("vLLM server 未能优雅停止，强制终止...")
                 os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
-                self.process.wait()
+                await self.process.wait()
                 logger.info("vLLM server 已强制终止")
         except Exception as e:
             logger.error(f"停止 vLLM server 时出错: {e}", exc_info=True)
@@ -283,6 +313,28 @@ class VLLMServerManager:
             self.process = None
 
 
+def _visible_gpu_count() -> Optional[int]:
+    """统计当前进程可见的 GPU 数量，无法确定时返回 None。
+
+    优先解析 CUDA_VISIBLE_DEVICES，未设置时调用一次 nvidia-smi -L。
+    """
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible is not None:
+        return len([d for d in visible.split(",") if d.strip()])
+
+    nvidia_smi = shutil.which("nvidia-smi")
+    if nvidia_smi is None:
+        return None
+    try:
+        result = subprocess.run(
+            [nvidia_smi, "-L"], capture_output=True, text=True, timeout=10, check=True
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"nvidia-smi 查询 GPU 失败: {e}")
+        return None
+    return sum(1 for line in result.stdout.splitlines() if line.startswith("GPU "))
+
+
 # 全局 vLLM server 管理器实例
 _vllm_server_manager: Optional[VLLMServerManager] = None
 
@@ -325,6 +377,7 @@ async def install_vllm(config: Optional[VLLMConfig]):
             temperature=config.temperature,
             top_p=config.top_p,
             timeout=config.timeout,
+            max_concurrency=config.max_concurrency,
         )
 
         # 注册到全局 provider
@@ -348,9 +401,15 @@ async def install_vllm(config: Optional[VLLMConfig]):
 
 
 async def uninstall_vllm():
-    """卸载 vLLM（停止 server 进程）"""
+    """卸载 vLLM（关闭客户端连接池并停止 server 进程）"""
     global _vllm_server_manager
     
+    from pkg.tide_vllm.provider import global_provider
+
+    client = global_provider().vllm_client
+    if client is not None:
+        await client.aclose()
+
     if _vllm_server_manager:
         await _vllm_server_manager.stop()
         _vllm_server_manager = None
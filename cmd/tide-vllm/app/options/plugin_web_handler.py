@@ -11,11 +11,15 @@ Plugin: Web Handler - Web 处理器插件
 """
 
 import logging
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .options import VLLMConfig
 
 logger = logging.getLogger(__name__)
 
 
-def install_web_handler(web_server):
+def install_web_handler(web_server, vllm_config: Optional["VLLMConfig"] = None):
     """安装 Web 处理器。
 
     该函数设置 DDD 层：
@@ -29,11 +33,16 @@ def install_web_handler(web_server):
         from pkg.tide_vllm.domain.chat import ChatFactory, FactoryConfig
         from pkg.tide_vllm.infrastructure.vllm import VLLMChatRepository
         from pkg.tide_vllm.application import Application, Commands, ChatHandler
+        from pkg.tide_vllm.provider import global_provider
         from web.modules.tidevllm.controller import ChatController
 
         # 1. 创建带有基础设施仓库的领域工厂
+        cache_size = vllm_config.response_cache_size if vllm_config else 0
+        chat_repository = VLLMChatRepository(cache_size=cache_size)
+        # 注册到 provider，供健康检查等读取响应缓存统计
+        global_provider().chat_repository = chat_repository
         factory_config = FactoryConfig(
-            chat_repository=VLLMChatRepository()
+            chat_repository=chat_repository
         )
         chat_factory = ChatFactory(factory_config)
 
@@ -8,12 +8,13 @@ Licensed under the Apache License, Version 2.0 (the "License");
 Tide VLLM Server - vLLM 模板示例服务
 """
 
-import asyncio
 from pathlib import Path
 from typing import Optional
 
 import click
 
+from tide.app import run_event_loop
+
 from .options import ServerRunOptions
 
 
@@ -51,5 +52,5 @@ def run_command(config_file: str):
     # 完成配置选项（设置默认值）
     completed_options = options.complete()
 
-    # 运行服务器
-    asyncio.run(completed_options.run())
+    # 运行服务器（安装了 uvloop 时使用 uvloop 事件循环）
+    run_event_loop(completed_options.run())
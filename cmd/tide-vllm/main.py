@@ -17,8 +17,6 @@ Tide VLLM Service - vLLM 模板示例服务
 使用千问3（Qwen3）模型作为示例
 """
 
-import asyncio
-import signal
 import sys
 from pathlib import Path
 
@@ -27,21 +25,19 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))  # 添加项目根目录（包含 pkg, web）
 sys.path.insert(0, str(project_root / "src"))  # 添加 src 目录（包含 tide 框架）
 
-from app.server import new_command
+_VERSION_FLAGS = ("-v", "--version")
 
 
 def main():
     """Main entry point."""
-    # 设置信号处理
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # --version 无需加载命令行与服务依赖
+    if any(arg in _VERSION_FLAGS for arg in sys.argv[1:]):
+        from tide import __version__
 
-    # 处理关闭信号
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(
-            sig,
-            lambda s=sig: asyncio.create_task(shutdown(s, loop))
-        )
+        print(f"tide-vllm version {__version__}")
+        return
+
+    from app.server import new_command
 
     try:
         command = new_command()
@@ -53,15 +49,5 @@ def main():
         sys.exit(1)
 
 
-async def shutdown(sig, loop):
-    """清理与服务关闭相关的任务。"""
-    print(f"接收到退出信号 {sig.name}...")
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-    for task in tasks:
-        task.cancel()
-    await asyncio.gather(*tasks, return_exceptions=True)
-    loop.stop()
-
-
 if __name__ == "__main__":
     main()
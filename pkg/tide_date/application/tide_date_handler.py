@@ -10,8 +10,11 @@ TideDate Handler - Application handler for date operations
 Similar to sea's seadate.command.application.go
 """
 
+from typing import Awaitable
+
 from ..domain.date import (
     DateFactory,
+    TideDate,
     NowRequest,
     NowResponse,
     NowErrorRequest,
@@ -25,25 +28,31 @@ class TideDateHandler:
     Similar to sea's SeaDateHandler struct.
     """
 
-    def __init__(self, factory: DateFactory):
+    __slots__ = ("_factory", "_tide_date")
+
+    _factory: DateFactory
+    _tide_date: TideDate
+
+    def __init__(self, factory: DateFactory) -> None:
         """Initialize handler.
 
         Similar to sea's NewSeaDateHandler function.
         """
         self._factory = factory
+        # The factory hands out one shared entity; resolve it once here
+        self._tide_date = factory.new_tide_date()
 
-    async def now(self, req: NowRequest) -> NowResponse:
+    def now(self, req: NowRequest) -> Awaitable[NowResponse]:
         """Handle Now request.
 
-        Similar to sea's SeaDateHandler.Now method.
+        Similar to sea's SeaDateHandler.Now method. Returns the entity's
+        coroutine directly so no extra coroutine frame wraps it.
         """
-        handler = self._factory.new_tide_date()
-        return await handler.now(req)
+        return self._tide_date.now(req)
 
-    async def now_error(self, req: NowErrorRequest) -> NowErrorResponse:
+    def now_error(self, req: NowErrorRequest) -> Awaitable[NowErrorResponse]:
         """Handle NowError request.
 
         Similar to sea's SeaDateHandler.NowError method.
         """
-        handler = self._factory.new_tide_date()
-        return await handler.now_error(req)
+        return self._tide_date.now_error(req)
@@ -11,8 +11,8 @@ Similar to sea's date.entity.go
 """
 
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Optional
 
 from ..kit.date import Repository as KitDateRepository
 from ..kit.date import NowRequest as KitNowRequest
@@ -21,42 +21,55 @@ from .error import ErrInternal
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class NowRequest:
     """Now request."""
 
     request_id: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NowResponse:
     """Now response."""
 
     date: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NowErrorRequest:
     """NowError request."""
 
     request_id: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NowErrorResponse:
     """NowError response."""
 
     date: str = ""
 
 
+# Kit requests carry no per-call data (or only the default request id),
+# so the common cases share one instance instead of allocating per request
+_EMPTY_KIT_NOW = KitNowRequest()
+_EMPTY_KIT_NOW_ERROR = KitNowErrorRequest()
+
+
 class TideDate:
     """TideDate entity.
 
     Similar to sea's SeaDate struct.
     """
 
-    def __init__(self, date_repository: KitDateRepository):
+    __slots__ = ("date_repository",)
+
+    date_repository: KitDateRepository
+
+    def __init__(self, date_repository: KitDateRepository) -> None:
         self.date_repository = date_repository
 
     async def now(self, req: NowRequest) -> NowResponse:
@@ -64,27 +77,29 @@ class TideDate:
 
         Similar to sea's SeaDate.Now method.
         """
+        kit_req = _EMPTY_KIT_NOW
+        # Only the repository call can fail; keep the protected region to it
         try:
-            kit_req = KitNowRequest()
             kit_resp = await self.date_repository.now(kit_req)
-
-            return NowResponse(date=kit_resp.date)
-
         except Exception as e:
-            logger.error(f"failed to call Now, err: {e}")
+            logger.error("failed to call Now, err: %s", e)
             raise ErrInternal(str(e)) from e
 
+        return NowResponse(date=kit_resp.date)
+
     async def now_error(self, req: NowErrorRequest) -> NowErrorResponse:
         """Get current date/time with error.
 
         Similar to sea's SeaDate.NowError method.
         """
-        try:
+        if req.request_id:
             kit_req = KitNowErrorRequest(request_id=req.request_id)
+        else:
+            kit_req = _EMPTY_KIT_NOW_ERROR
+        try:
             kit_resp = await self.date_repository.now_error(kit_req)
-
-            return NowErrorResponse(date=kit_resp.date)
-
         except Exception as e:
-            logger.error(f"failed to call NowError, err: {e}")
+            logger.error("failed to call NowError, err: %s", e)
             raise ErrInternal(str(e)) from e
+
+        return NowErrorResponse(date=kit_resp.date)
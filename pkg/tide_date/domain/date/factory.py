@@ -46,11 +46,16 @@ class DateFactory:
     Similar to sea's Factory struct.
     """
 
+    __slots__ = ("_config", "_tide_date")
+
+    _config: FactoryConfig
+    _tide_date: TideDate
+
     def __init__(
         self,
         config: FactoryConfig,
         config_funcs: Optional[List[FactoryConfigFunc]] = None
-    ):
+    ) -> None:
         """Initialize factory.
 
         Similar to sea's NewFactory function.
@@ -64,10 +69,13 @@ class DateFactory:
         config.validate()
 
         self._config = config
+        # TideDate holds no per-request state, so every caller can share one
+        self._tide_date = TideDate(date_repository=config.date_repository)
 
     def new_tide_date(self) -> TideDate:
-        """Create a new TideDate entity.
+        """Return the TideDate entity.
 
-        Similar to sea's Factory.NewSeaDate method.
+        Similar to sea's Factory.NewSeaDate method. The entity is stateless
+        beyond its repository and is built once per factory.
         """
-        return TideDate(date_repository=self._config.date_repository)
+        return self._tide_date
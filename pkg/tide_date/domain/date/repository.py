@@ -10,23 +10,21 @@ Date Repository Interface
 Similar to sea's date.entity.repository.go
 """
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from .entity import NowRequest, NowResponse, NowErrorRequest, NowErrorResponse
 
 
-class DateRepository(ABC):
+class DateRepository(Protocol):
     """Date repository interface.
 
     Similar to sea's Repository interface in domain/date.
     """
 
-    @abstractmethod
     async def now(self, req: NowRequest) -> NowResponse:
         """Get current date/time."""
-        pass
+        ...
 
-    @abstractmethod
     async def now_error(self, req: NowErrorRequest) -> NowErrorResponse:
         """Get current date/time with error."""
-        pass
+        ...
@@ -10,51 +10,52 @@ Date Kit Repository - Low-level date repository interface
 Similar to sea's domain/kit/date/date.repository.go
 """
 
-from abc import ABC, abstractmethod
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Protocol
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class NowRequest:
     """Now request."""
 
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NowResponse:
     """Now response."""
 
     date: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NowErrorRequest:
     """NowError request."""
 
     request_id: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NowErrorResponse:
     """NowError response."""
 
     date: str = ""
 
 
-class Repository(ABC):
+class Repository(Protocol):
     """Date repository interface.
 
     Similar to sea's Repository interface in domain/kit/date.
     """
 
-    @abstractmethod
     async def now(self, req: NowRequest) -> NowResponse:
         """Get current date/time."""
-        pass
+        ...
 
-    @abstractmethod
     async def now_error(self, req: NowErrorRequest) -> NowErrorResponse:
         """Get current date/time with error."""
-        pass
+        ...
@@ -10,18 +10,50 @@ Local Date Repository - Local implementation of date repository
 Similar to sea's local.date.repository.go
 """
 
-from datetime import datetime
+import time
+from typing import Dict, Tuple
 
 from ...domain.kit.date import (
-    Repository,
     NowRequest,
     NowResponse,
     NowErrorRequest,
     NowErrorResponse,
 )
 
+# Formatted time per millisecond bucket; holds at most a couple of entries.
+_now_cache: Dict[int, str] = {}
 
-class LocalDateRepository(Repository):
+# "YYYY-MM-DD HH:MM:SS" for the current second, as (epoch second, text).
+_second_prefix: Tuple[int, str] = (-1, "")
+
+
+def _now_str() -> str:
+    """Return the current local time as a string, memoized per millisecond.
+
+    Requests landing in the same millisecond share one formatted string
+    instead of each building a datetime and formatting it.
+    """
+    global _second_prefix
+
+    now_ns = time.time_ns()
+    bucket = now_ns // 1_000_000
+    cached = _now_cache.get(bucket)
+    if cached is None:
+        # localtime/strftime only run once per second; within a second a
+        # miss just appends the microseconds from the same timestamp
+        seconds, nanos = divmod(now_ns, 1_000_000_000)
+        second, prefix = _second_prefix
+        if second != seconds:
+            prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+            _second_prefix = (seconds, prefix)
+        cached = f"{prefix}.{nanos // 1000:06d}"
+        if len(_now_cache) > 2:
+            _now_cache.clear()
+        _now_cache[bucket] = cached
+    return cached
+
+
+class LocalDateRepository:
     """Local implementation of date repository.
 
     Similar to sea's Repository struct in infrastructure/local.
@@ -32,7 +64,7 @@ class LocalDateRepository(Repository):
 
         Similar to sea's Repository.Now method.
         """
-        return NowResponse(date=str(datetime.now()))
+        return NowResponse(date=_now_str())
 
     async def now_error(self, req: NowErrorRequest) -> NowErrorResponse:
         """Get current date/time with error.
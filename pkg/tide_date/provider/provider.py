@@ -10,18 +10,22 @@ Provider - Global dependency injection container
 Similar to sea's provider.go
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
+# slots (Python 3.10+) turn attribute reads on the hot path into slot lookups
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Provider:
     """Provider for global instance.
 
     Similar to sea's Provider struct.
     """
 
-    config: Dict[str, Any] = field(default_factory=dict)
+    config: Mapping[str, Any] = field(default_factory=dict)
     mysql: Optional[Any] = None  # SQLAlchemy session or connection
     redis: Optional[Any] = None  # Redis client
     resolver_service: Optional[Any] = None
@@ -5,10 +5,12 @@
 """
 
 import logging
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from pkg.tide_vllm.domain.chat import (
+    ChatChunk,
     ChatFactory,
     ChatMessage,
     ChatRequest,
@@ -18,8 +20,11 @@ from pkg.tide_vllm.domain.chat import (
 
 logger = logging.getLogger(__name__)
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ChatCompletionRequest:
     """聊天补全请求"""
     request_id: str
@@ -30,7 +35,7 @@ class ChatCompletionRequest:
     top_p: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChatCompletionResponse:
     """聊天补全响应"""
     request_id: str
@@ -40,6 +45,23 @@ class ChatCompletionResponse:
     finish_reason: str = ""
 
 
+def _domain_request(request: ChatCompletionRequest) -> ChatRequest:
+    """构建领域请求：可选的系统提示词 + 用户消息"""
+    user_message = ChatMessage(MessageRole.USER, request.prompt)
+    messages: List[ChatMessage] = (
+        [ChatMessage(MessageRole.SYSTEM, request.system_prompt), user_message]
+        if request.system_prompt
+        else [user_message]
+    )
+    return ChatRequest(
+        request_id=request.request_id,
+        messages=messages,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        top_p=request.top_p,
+    )
+
+
 class ChatHandler:
     """聊天处理器
     
@@ -53,6 +75,8 @@ class ChatHandler:
             factory: 聊天工厂
         """
         self._factory = factory
+        # 请求路径直接调用仓库，省去工厂的转发层
+        self._repository = factory.repository
     
     async def chat_completion(
         self, request: ChatCompletionRequest
@@ -65,35 +89,10 @@ class ChatHandler:
         Returns:
             ChatCompletionResponse: 聊天补全响应
         """
-        logger.info(f"处理聊天补全: request_id={request.request_id}")
-        
-        # 构建消息列表
-        messages: List[ChatMessage] = []
-        
-        # 添加系统提示词
-        if request.system_prompt:
-            messages.append(ChatMessage(
-                role=MessageRole.SYSTEM,
-                content=request.system_prompt,
-            ))
-        
-        # 添加用户消息
-        messages.append(ChatMessage(
-            role=MessageRole.USER,
-            content=request.prompt,
-        ))
-        
-        # 创建领域请求
-        domain_request = self._factory.create_request(
-            request_id=request.request_id,
-            messages=messages,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            top_p=request.top_p,
-        )
+        logger.info("处理聊天补全: request_id=%s", request.request_id)
         
-        # 调用领域服务
-        domain_response = await self._factory.chat(domain_request)
+        # 创建领域请求并调用仓库
+        domain_response = await self._repository.chat(_domain_request(request))
         
         # 转换为应用响应
         return ChatCompletionResponse(
@@ -104,10 +103,24 @@ class ChatHandler:
             finish_reason=domain_response.finish_reason,
         )
     
+    def chat_completion_stream(
+        self, request: ChatCompletionRequest
+    ) -> AsyncIterator[ChatChunk]:
+        """流式处理聊天补全请求
+        
+        Args:
+            request: 聊天补全请求
+            
+        Returns:
+            AsyncIterator[ChatChunk]: 按生成顺序产出的响应片段
+        """
+        logger.info("处理流式聊天补全: request_id=%s", request.request_id)
+        return self._repository.chat_stream(_domain_request(request))
+    
     async def health_check(self) -> bool:
         """健康检查
         
         Returns:
             bool: 服务是否健康
         """
-        return await self._factory.repository.health_check()
+        return await self._repository.health_check()
@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
 """Chat Domain Package"""
 
-from .entity import ChatEntity, ChatMessage, ChatRequest, ChatResponse, MessageRole
+from .entity import (
+    ChatChunk,
+    ChatEntity,
+    ChatMessage,
+    ChatRequest,
+    ChatResponse,
+    MessageRole,
+)
 from .factory import ChatFactory, FactoryConfig
 from .repository import ChatRepository
 
 __all__ = [
+    "ChatChunk",
     "ChatEntity",
     "ChatMessage", 
     "ChatRequest",
@@ -4,26 +4,43 @@
 定义聊天相关的领域实体和值对象
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
-from enum import Enum
+from typing import List, NamedTuple, Optional
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class MessageRole(str, Enum):
-    """消息角色枚举"""
+
+class MessageRole:
+    """消息角色常量
+
+    直接使用字符串，写入请求负载时无需 Enum 取值
+    """
     SYSTEM = "system"
     USER = "user"
     ASSISTANT = "assistant"
 
 
-@dataclass
-class ChatMessage:
-    """聊天消息值对象"""
-    role: MessageRole
+class ChatMessage(NamedTuple):
+    """聊天消息值对象
+
+    (role, content) 二元组，构造开销远低于 dataclass
+    """
+    role: str
     content: str
 
 
-@dataclass
+class ChatChunk(NamedTuple):
+    """流式聊天响应片段值对象
+
+    每个生成片段都会构造一次，使用元组保持开销最低
+    """
+    content: str
+    finish_reason: str = ""
+
+
+@dataclass(**_SLOTS)
 class ChatRequest:
     """聊天请求值对象"""
     request_id: str
@@ -33,7 +50,7 @@ class ChatRequest:
     top_p: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChatResponse:
     """聊天响应值对象"""
     request_id: str
@@ -43,7 +60,7 @@ class ChatResponse:
     finish_reason: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChatEntity:
     """聊天领域实体
     
@@ -53,7 +70,7 @@ class ChatEntity:
     messages: List[ChatMessage] = field(default_factory=list)
     response: Optional[ChatResponse] = None
     
-    def add_message(self, role: MessageRole, content: str) -> None:
+    def add_message(self, role: str, content: str) -> None:
         """添加消息到会话"""
         self.messages.append(ChatMessage(role=role, content=content))
     
@@ -4,19 +4,17 @@
 定义聊天仓库的抽象接口
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional, Protocol
 
-from .entity import ChatRequest, ChatResponse
+from .entity import ChatChunk, ChatRequest, ChatResponse
 
 
-class ChatRepository(ABC):
-    """聊天仓库抽象基类
+class ChatRepository(Protocol):
+    """聊天仓库接口（结构化类型，实现类无需继承）
     
     定义与 LLM 服务交互的接口
     """
     
-    @abstractmethod
     async def chat(self, request: ChatRequest) -> ChatResponse:
         """发送聊天请求
         
@@ -26,13 +24,23 @@ class ChatRepository(ABC):
         Returns:
             ChatResponse: 聊天响应
         """
-        pass
+        ...
+    
+    def chat_stream(self, request: ChatRequest) -> AsyncIterator[ChatChunk]:
+        """流式发送聊天请求
+        
+        Args:
+            request: 聊天请求
+            
+        Returns:
+            AsyncIterator[ChatChunk]: 按生成顺序产出的响应片段
+        """
+        ...
     
-    @abstractmethod
     async def health_check(self) -> bool:
         """健康检查
         
         Returns:
             bool: 服务是否健康
         """
-        pass
+        ...
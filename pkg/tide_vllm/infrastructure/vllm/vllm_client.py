@@ -5,12 +5,28 @@
 使用 OpenAI 兼容的 API 格式
 """
 
+import asyncio
+import copy
+import json
 import logging
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 
+try:
+    # orjson 由 C 扩展直接编码为 bytes，长 prompt 下明显快于标准库 json
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +45,7 @@ class VLLMClient:
     temperature: float = 0.7
     top_p: float = 0.9
     timeout: int = 60
+    max_concurrency: int = 64
     
     def __post_init__(self):
         """初始化客户端"""
@@ -38,6 +55,53 @@ class VLLMClient:
         }
         if self.api_key:
             self._headers["Authorization"] = f"Bearer {self.api_key}"
+        # 请求负载模板，每次请求复制后只覆盖调用方指定的字段。
+        # 键顺序固定，与各次请求保持相同的 dict 形状；messages 放在最后
+        self._default_payload: Dict[str, Any] = {
+            "model": self.model_name,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "stream": False,
+            "messages": None,
+        }
+        # 全部使用默认参数时的预编码 JSON 框架：只需序列化 messages 并拼接，
+        # 结果与完整序列化 _default_payload 的 bytes 一致
+        frame = {k: v for k, v in self._default_payload.items() if k != "messages"}
+        self._body_prefix = _json_dumps(frame)[:-1] + b',"messages":'
+        self._chat_url = f"{self._base_url}/v1/chat/completions"
+        # 长连接复用的 HTTP 客户端，首次请求时创建
+        self._client: Optional[httpx.AsyncClient] = None
+        # 进行中的确定性请求（temperature=0），按请求负载合并
+        self._inflight: Dict[bytes, "asyncio.Task[Dict[str, Any]]"] = {}
+        # 限制同时发往 vLLM 的请求数，超出的请求在本地排队
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        # /v1/models 结果缓存：(获取时刻, 模型列表)，在 TTL 内直接复用
+        self._models_cache: Optional[Tuple[float, List[str]]] = None
+        self._models_ttl = 2.0
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """获取共享的 HTTP 客户端
+        
+        所有请求复用同一个连接池，避免每次请求重新建立 TCP 连接。
+        空闲连接保持至 max_concurrency 个、存活 75 秒，请求间隙不会被回收重连
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(64, self.max_concurrency),
+                    max_connections=max(256, self.max_concurrency),
+                    keepalive_expiry=75.0,
+                ),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """关闭 HTTP 客户端，释放连接"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @property
     def base_url(self) -> str:
@@ -68,32 +132,139 @@ class VLLMClient:
         Returns:
             Dict: API 响应
         """
-        url = f"{self._base_url}/v1/chat/completions"
-        
-        payload = {
-            "model": model or self.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens or self.max_tokens,
-            "temperature": temperature if temperature is not None else self.temperature,
-            "top_p": top_p if top_p is not None else self.top_p,
-            "stream": stream,
-        }
+        url = self._chat_url
+        
+        # 负载只序列化一次：模板保证键顺序固定，编码后的 bytes 同时作为合并键
+        if not (model or max_tokens or stream) and temperature is None and top_p is None:
+            # 全部使用默认参数：预编码的框架 + messages
+            body = self._body_prefix + _json_dumps(messages) + b"}"
+            temperature = self.temperature
+        else:
+            payload = self._build_payload(
+                messages, model, max_tokens, temperature, top_p, stream
+            )
+            temperature = payload["temperature"]
+            body = _json_dumps(payload)
         
-        logger.debug(f"发送请求到 vLLM: {url}")
-        logger.debug(f"请求负载: {payload}")
+        # temperature=0 时输出确定，负载相同的并发请求合并为一次 vLLM 调用。
+        # 聊天接口无法在一个请求里携带多组对话，批处理交给 vLLM 的连续批调度
+        if temperature == 0 and not stream:
+            task = self._inflight.get(body)
+            if task is None:
+                task = asyncio.ensure_future(self._post_chat_completion(url, body))
+                self._inflight[body] = task
+                task.add_done_callback(lambda _, k=body: self._inflight.pop(k, None))
+            else:
+                logger.debug("合并到进行中的相同请求")
+            # shield：单个调用方取消不影响其他等待者；
+            # 结果共享给所有等待者，各自拿一份深拷贝，避免互相修改
+            return copy.deepcopy(await asyncio.shield(task))
+        
+        return await self._post_chat_completion(url, body)
+    
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        top_p: Optional[float],
+        stream: bool,
+    ) -> Dict[str, Any]:
+        """复制负载模板，只覆盖调用方指定的字段"""
+        payload = self._default_payload.copy()
+        if model:
+            payload["model"] = model
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        if temperature is not None:
+            payload["temperature"] = temperature
+        if top_p is not None:
+            payload["top_p"] = top_p
+        if stream:
+            payload["stream"] = True
+        payload["messages"] = messages
+        return payload
+    
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """流式聊天补全
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
+        逐个产出 vLLM 返回的 SSE 数据块（chat.completion.chunk），
+        不在本地缓冲完整响应。流式请求不参与相同请求合并
+        
+        Args:
+            messages: 消息列表，格式为 [{"role": "user", "content": "..."}]
+            model: 模型名称，默认使用配置的模型
+            max_tokens: 最大生成 token 数
+            temperature: 温度参数
+            top_p: top_p 参数
+            
+        Yields:
+            Dict: 解析后的数据块
+        """
+        body = _json_dumps(self._build_payload(
+            messages, model, max_tokens, temperature, top_p, stream=True
+        ))
+        logger.debug("发送流式请求到 vLLM: %s", self._chat_url)
+        
+        async with self._sem:
+            async with self._get_client().stream(
+                "POST",
+                self._chat_url,
+                content=body,
+                headers=self._headers,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # SSE 格式："data: {...}"，以 "data: [DONE]" 结束，忽略空行和注释
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    yield _json_loads(data)
+    
+    async def _post_chat_completion(self, url: str, body: bytes) -> Dict[str, Any]:
+        """发送聊天补全 HTTP 请求"""
+        logger.debug("发送请求到 vLLM: %s", url)
+        logger.debug("请求负载: %s", body)
+        
+        async with self._sem:
+            response = await self._get_client().post(
                 url,
-                json=payload,
+                content=body,
                 headers=self._headers,
             )
             response.raise_for_status()
-            result = response.json()
-            
-        logger.debug(f"vLLM 响应: {result}")
+            result = _json_loads(response.content)
+        
+        logger.debug("vLLM 响应: %s", result)
         return result
     
+    async def _get_models(self, timeout: float) -> List[str]:
+        """获取 /v1/models 中的模型列表
+
+        成功结果缓存 _models_ttl 秒，健康轮询期间不会重复请求；失败时抛出异常且不缓存
+        """
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < self._models_ttl:
+            return cached[1]
+        
+        url = f"{self._base_url}/v1/models"
+        response = await self._get_client().get(url, headers=self._headers, timeout=timeout)
+        response.raise_for_status()
+        result = _json_loads(response.content)
+        models = [model["id"] for model in result.get("data", [])]
+        self._models_cache = (time.monotonic(), models)
+        return models
+    
     async def health_check(self) -> bool:
         """健康检查
         
@@ -104,26 +275,18 @@ class VLLMClient:
         """
         try:
             # 使用 /v1/models 端点检查模型是否就绪
-            url = f"{self._base_url}/v1/models"
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(url, headers=self._headers)
-                if response.status_code == 200:
-                    data = response.json()
-                    model_names = [model["id"] for model in data.get("data", [])]
-                    # 检查配置的模型是否在可用模型列表中
-                    is_ready = self.model_name in model_names
-                    if not is_ready:
-                        logger.debug(
-                            f"模型 {self.model_name} 尚未就绪，"
-                            f"当前可用模型: {model_names}"
-                        )
-                    return is_ready
-                else:
-                    logger.debug(f"vLLM server 返回状态码: {response.status_code}")
-                    return False
+            model_names = await self._get_models(timeout=5)
         except Exception as e:
-            logger.warning(f"vLLM 健康检查失败: {e}")
+            logger.warning("vLLM 健康检查失败: %s", e)
             return False
+        
+        # 检查配置的模型是否在可用模型列表中
+        is_ready = self.model_name in model_names
+        if not is_ready:
+            logger.debug(
+                "模型 %s 尚未就绪，当前可用模型: %s", self.model_name, model_names
+            )
+        return is_ready
     
     async def list_models(self) -> List[str]:
         """获取可用模型列表
@@ -132,12 +295,7 @@ class VLLMClient:
             List[str]: 模型名称列表
         """
         try:
-            url = f"{self._base_url}/v1/models"
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, headers=self._headers)
-                response.raise_for_status()
-                result = response.json()
-                return [model["id"] for model in result.get("data", [])]
+            return list(await self._get_models(timeout=10))
         except Exception as e:
-            logger.error(f"获取模型列表失败: {e}")
+            logger.error("获取模型列表失败: %s", e)
             return []
@@ -4,24 +4,46 @@
 实现 ChatRepository 接口，使用 vLLM 客户端与服务交互
 """
 
+import dataclasses
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Optional, Tuple
 
-from pkg.tide_vllm.domain.chat import ChatRepository, ChatRequest, ChatResponse
+from pkg.tide_vllm.domain.chat import ChatChunk, ChatRequest, ChatResponse
 from pkg.tide_vllm.provider import global_provider
 
 logger = logging.getLogger(__name__)
 
+# 响应缓存键：(模型, 消息元组, max_tokens, top_p)
+_CacheKey = Tuple[str, tuple, Optional[int], Optional[float]]
 
-class VLLMChatRepository(ChatRepository):
+
+class VLLMChatRepository:
     """vLLM 聊天仓库实现
     
     使用 vLLM 客户端实现聊天功能
     """
     
-    def __init__(self):
-        """初始化仓库"""
-        pass
+    def __init__(self, cache_size: int = 0):
+        """初始化仓库
+        
+        Args:
+            cache_size: 确定性请求（temperature=0）响应缓存的最大条目数，
+                默认 0 表示不缓存。缓存没有过期时间，模型更新后需重启服务
+        """
+        self._cache_size = cache_size
+        self._response_cache: "OrderedDict[_CacheKey, ChatResponse]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    def cache_info(self) -> Dict[str, int]:
+        """获取响应缓存统计"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._response_cache),
+            "maxsize": self._cache_size,
+        }
     
     def _get_client(self):
         """获取 vLLM 客户端
@@ -36,6 +58,10 @@ class VLLMChatRepository(ChatRepository):
     async def chat(self, request: ChatRequest) -> ChatResponse:
         """发送聊天请求
         
+        每个请求直接发往 vLLM，不在本地排队攒批：并发请求会同时到达
+        vLLM，由其连续批调度器合并成运行批次；并发上限由
+        VLLMClient.max_concurrency 控制
+        
         Args:
             request: 聊天请求
             
@@ -44,13 +70,37 @@ class VLLMChatRepository(ChatRepository):
         """
         client = self._get_client()
         
-        # 转换消息格式
+        # temperature=0 时输出确定，完全相同的请求直接返回缓存的响应。
+        # ChatMessage 为字符串元组，消息列表转成元组即可作为键，无需序列化
+        cache_key: Optional[_CacheKey] = None
+        temperature = (
+            request.temperature if request.temperature is not None else client.temperature
+        )
+        if self._cache_size > 0 and temperature == 0:
+            cache_key = (
+                client.model_name,
+                tuple(request.messages),
+                request.max_tokens,
+                request.top_p,
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                logger.debug("命中响应缓存: request_id=%s", request.request_id)
+                return dataclasses.replace(
+                    cached, request_id=request.request_id, usage=dict(cached.usage)
+                )
+            self._cache_misses += 1
+        
+        # 转换消息格式。消息按原顺序原样发送，多轮对话的历史前缀在 token 层面
+        # 保持一致，可命中 vLLM 的自动前缀缓存（--enable-prefix-caching）
         messages = [
-            {"role": msg.role.value, "content": msg.content}
-            for msg in request.messages
+            {"role": role, "content": content}
+            for role, content in request.messages
         ]
         
-        logger.info(f"处理聊天请求: request_id={request.request_id}")
+        logger.info("处理聊天请求: request_id=%s", request.request_id)
         
         try:
             # 调用 vLLM API
@@ -61,14 +111,17 @@ class VLLMChatRepository(ChatRepository):
                 top_p=request.top_p,
             )
             
-            # 解析响应
-            choice = result.get("choices", [{}])[0]
-            message = choice.get("message", {})
-            content = message.get("content", "")
-            finish_reason = choice.get("finish_reason", "")
+            # 解析响应：正常响应直接按路径取值，缺字段时再回退为空值，
+            # 避免每次都构造 get 的默认值字面量
+            try:
+                choice = result["choices"][0]
+                content = choice["message"]["content"]
+                finish_reason = choice.get("finish_reason", "")
+            except (KeyError, IndexError):
+                content, finish_reason = "", ""
             
-            usage = result.get("usage", {})
-            model = result.get("model", "")
+            usage = result.get("usage") or {}
+            model = result.get("model") or ""
             
             response = ChatResponse(
                 request_id=request.request_id,
@@ -79,16 +132,66 @@ class VLLMChatRepository(ChatRepository):
             )
             
             logger.info(
-                f"聊天请求完成: request_id={request.request_id}, "
-                f"tokens={usage.get('total_tokens', 0)}"
+                "聊天请求完成: request_id=%s, tokens=%s",
+                request.request_id,
+                usage.get("total_tokens", 0),
             )
             
+            # 只缓存正常解析出内容的响应
+            if cache_key is not None and content:
+                # 缓存自己的 usage 副本，调用方修改返回值不会污染缓存
+                self._response_cache[cache_key] = dataclasses.replace(
+                    response, usage=dict(usage)
+                )
+                if len(self._response_cache) > self._cache_size:
+                    self._response_cache.popitem(last=False)
+            
             return response
             
         except Exception as e:
-            logger.error(f"聊天请求失败: request_id={request.request_id}, error={e}")
+            logger.error("聊天请求失败: request_id=%s, error=%s", request.request_id, e)
             raise
     
+    async def chat_stream(self, request: ChatRequest) -> AsyncIterator[ChatChunk]:
+        """流式发送聊天请求
+        
+        片段随 vLLM 生成即时产出，不经过响应缓存
+        
+        Args:
+            request: 聊天请求
+            
+        Yields:
+            ChatChunk: 响应片段（只包含本次新增的内容）
+        """
+        client = self._get_client()
+        messages = [
+            {"role": role, "content": content}
+            for role, content in request.messages
+        ]
+        
+        logger.info("处理流式聊天请求: request_id=%s", request.request_id)
+        
+        try:
+            async for chunk in client.chat_completion_stream(
+                messages=messages,
+                max_tokens=request.max_tokens,
+                temperature=request.temperature,
+                top_p=request.top_p,
+            ):
+                try:
+                    choice = chunk["choices"][0]
+                except (KeyError, IndexError):
+                    continue
+                content = (choice.get("delta") or {}).get("content") or ""
+                finish_reason = choice.get("finish_reason") or ""
+                if content or finish_reason:
+                    yield ChatChunk(content, finish_reason)
+        except Exception as e:
+            logger.error("流式聊天请求失败: request_id=%s, error=%s", request.request_id, e)
+            raise
+        
+        logger.info("流式聊天请求完成: request_id=%s", request.request_id)
+    
     async def health_check(self) -> bool:
         """健康检查
         
@@ -112,5 +215,5 @@ class VLLMChatRepository(ChatRepository):
             client = self._get_client()
             return await client.health_check()
         except Exception as e:
-            logger.warning(f"健康检查失败: {e}")
+            logger.warning("健康检查失败: %s", e)
             return False
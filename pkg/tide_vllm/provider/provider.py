@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 """Provider - 全局服务提供者"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
-import threading
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Provider:
     """全局服务提供者。
     
@@ -15,18 +18,21 @@ class Provider:
     config: Dict[str, Any] = field(default_factory=dict)
     vllm_client: Optional[Any] = None
     vllm_server_manager: Optional[Any] = None  # VLLMServerManager 实例
+    chat_repository: Optional[Any] = None  # VLLMChatRepository 实例
+
+    def response_cache_info(self) -> Optional[Dict[str, int]]:
+        """获取聊天响应缓存统计（命中、未命中、条目数、容量），未启用缓存时返回 None。"""
+        repository = self.chat_repository
+        if repository is None:
+            return None
+        info = repository.cache_info()
+        return info if info["maxsize"] > 0 else None
 
 
-# 全局单例
-_global_provider: Optional[Provider] = None
-_provider_lock = threading.Lock()
+# 全局单例，导入时创建（模块导入本身由导入锁保证只执行一次）
+_global_provider = Provider()
 
 
 def global_provider() -> Provider:
     """获取全局 Provider 单例。"""
-    global _global_provider
-    if _global_provider is None:
-        with _provider_lock:
-            if _global_provider is None:
-                _global_provider = Provider()
     return _global_provider
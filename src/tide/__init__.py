@@ -16,18 +16,58 @@ Tide - Python Web/gRPC Service Framework
 
 __version__ = "0.1.0"
 
-from tide.app.application import TideApp
-from tide.app.command import Command, CommandContext
-from tide.app.plugin import Plugin, PluginManager
-from tide.config.config import (
-    TideConfig,
-    WebConfig,
-    LogConfig,
-    DatabaseConfig,
-    OpenTelemetryConfig,
-)
-from tide.config.loader import load_config, load_config_from_file
-from tide.provider.provider import Provider, get_provider
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tide.app.application import TideApp
+    from tide.app.command import Command, CommandContext
+    from tide.app.plugin import Plugin, PluginManager
+    from tide.config.config import (
+        TideConfig,
+        WebConfig,
+        LogConfig,
+        DatabaseConfig,
+        OpenTelemetryConfig,
+    )
+    from tide.config.loader import load_config, load_config_from_file
+    from tide.provider.provider import Provider, get_provider
+
+# 公开名称 -> 所在模块，首次访问时才导入（PEP 562），
+# 只需要 __version__ 的场景（如 --version）不会加载 click 等依赖
+_LAZY_IMPORTS = {
+    "TideApp": "tide.app.application",
+    "Command": "tide.app.command",
+    "CommandContext": "tide.app.command",
+    "Plugin": "tide.app.plugin",
+    "PluginManager": "tide.app.plugin",
+    "TideConfig": "tide.config.config",
+    "WebConfig": "tide.config.config",
+    "LogConfig": "tide.config.config",
+    "DatabaseConfig": "tide.config.config",
+    "OpenTelemetryConfig": "tide.config.config",
+    "load_config": "tide.config.loader",
+    "load_config_from_file": "tide.config.loader",
+    "Provider": "tide.provider.provider",
+    "get_provider": "tide.provider.provider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Version
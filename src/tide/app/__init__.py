@@ -10,7 +10,7 @@ Tide App 模块
 - Plugin: 插件机制
 """
 
-from tide.app.application import TideApp
+from tide.app.application import TideApp, run_event_loop
 from tide.app.command import Command, CommandContext
 from tide.app.plugin import Plugin, PluginManager
 from tide.app.hooks import (
@@ -23,6 +23,7 @@ from tide.app.hooks import (
 
 __all__ = [
     "TideApp",
+    "run_event_loop",
     "Command",
     "CommandContext",
     "Plugin",
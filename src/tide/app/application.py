@@ -26,6 +26,25 @@ from tide.provider.provider import Provider, get_provider
 logger = logging.getLogger(__name__)
 
 
+def run_event_loop(main: Any) -> Any:
+    """
+    运行异步主协程
+
+    安装了 uvloop 时使用基于 libuv 的事件循环，否则使用标准 asyncio 事件循环
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+
+    uvloop.install()
+    return asyncio.run(main)
+
+
 class TideApp:
     """
     Tide 应用程序主类
@@ -170,6 +189,7 @@ class TideApp:
         name: str,
         func: Callable,
         priority: int = 0,
+        concurrent_safe: bool = False,
     ) -> "TideApp":
         """
         注册启动后钩子
@@ -178,11 +198,14 @@ class TideApp:
             name: 钩子名称
             func: 钩子函数
             priority: 优先级（越大越先执行）
+            concurrent_safe: 是否可与同优先级的其他 concurrent_safe 异步钩子并发执行
 
         Returns:
             self
         """
-        self._hook_manager.register(HookType.POST_START, name, func, priority)
+        self._hook_manager.register(
+            HookType.POST_START, name, func, priority, concurrent_safe
+        )
         return self
 
     def register_pre_shutdown_hook(
@@ -190,6 +213,7 @@ class TideApp:
         name: str,
         func: Callable,
         priority: int = 0,
+        concurrent_safe: bool = False,
     ) -> "TideApp":
         """
         注册关闭前钩子
@@ -198,11 +222,14 @@ class TideApp:
             name: 钩子名称
             func: 钩子函数
             priority: 优先级
+            concurrent_safe: 是否可与同优先级的其他 concurrent_safe 异步钩子并发执行
 
         Returns:
             self
         """
-        self._hook_manager.register(HookType.PRE_SHUTDOWN, name, func, priority)
+        self._hook_manager.register(
+            HookType.PRE_SHUTDOWN, name, func, priority, concurrent_safe
+        )
         return self
 
     def run_with_config(self, config_path: str) -> None:
@@ -229,11 +256,11 @@ class TideApp:
 
         # 运行异步主循环
         try:
-            asyncio.run(self._run_async())
+            run_event_loop(self._run_async())
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         except Exception as e:
-            logger.error(f"Application error: {e}", exc_info=True)
+            logger.error("Application error: %s", e, exc_info=True)
             sys.exit(1)
 
     async def _run_async(self) -> None:
@@ -242,23 +269,23 @@ class TideApp:
         self._shutdown_event = asyncio.Event()
 
         # 设置信号处理
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(
-                sig,
-                lambda s=sig: asyncio.create_task(self._handle_signal(s)),
-            )
+            loop.add_signal_handler(sig, self._on_signal, sig)
 
         try:
             # 安装插件
-            logger.info(f"Starting {self.name} v{self.version}")
+            logger.info("Starting %s v%s", self.name, self.version)
             await self._install_plugins()
 
             # 执行启动后钩子
             await self._hook_manager.run_hooks(HookType.POST_START)
 
+            # 启动阶段结束，之后不再允许注册依赖
+            self._provider.freeze()
+
             # 等待关闭信号
-            logger.info(f"{self.name} is running...")
+            logger.info("%s is running...", self.name)
             await self._shutdown_event.wait()
 
         finally:
@@ -269,12 +296,15 @@ class TideApp:
             # 卸载插件
             await self._uninstall_plugins()
 
+            # Provider 是进程级单例，解除冻结以便同一进程中再次启动应用
+            self._provider.unfreeze()
+
             self._running = False
-            logger.info(f"{self.name} stopped")
+            logger.info("%s stopped", self.name)
 
-    async def _handle_signal(self, sig: signal.Signals) -> None:
-        """处理系统信号"""
-        logger.info(f"Received signal {sig.name}")
+    def _on_signal(self, sig: signal.Signals) -> None:
+        """处理系统信号（在事件循环中同步调用）"""
+        logger.info("Received signal %s", sig.name)
         if self._shutdown_event:
             self._shutdown_event.set()
 
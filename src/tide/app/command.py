@@ -7,6 +7,7 @@ Command - 命令和上下文
 参考 Go 版本 sea 的 cobra.Command 实现
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
@@ -15,8 +16,11 @@ if TYPE_CHECKING:
     from tide.config.config import TideConfig
     from tide.provider.provider import Provider
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Command:
     """
     命令定义
@@ -34,7 +38,7 @@ class Command:
     aliases: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CommandContext:
     """
     命令执行上下文
@@ -8,13 +8,18 @@ Hooks - 钩子函数管理
 """
 
 import asyncio
+import bisect
 import logging
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class HookType(Enum):
     """钩子类型"""
@@ -30,7 +35,7 @@ PostStartHook = HookFunc
 PreShutdownHook = HookFunc
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HookEntry:
     """
     钩子条目
@@ -40,12 +45,23 @@ class HookEntry:
         func: 钩子函数
         priority: 优先级（越大越先执行）
         hook_type: 钩子类型
+        concurrent_safe: 是否可与同优先级、同样声明的异步钩子并发执行
+        is_async: 是否为协程函数（创建时计算一次）
     """
 
     name: str
     func: Union[HookFunc, AsyncHookFunc]
     priority: int = 0
     hook_type: HookType = HookType.POST_START
+    concurrent_safe: bool = False
+    is_async: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.is_async = asyncio.iscoroutinefunction(self.func)
+
+    def __lt__(self, other: "HookEntry") -> bool:
+        # 优先级高的排在前面，供 bisect.insort 维护有序列表
+        return self.priority > other.priority
 
 
 class HookManager:
@@ -67,6 +83,7 @@ class HookManager:
         name: str,
         func: Union[HookFunc, AsyncHookFunc],
         priority: int = 0,
+        concurrent_safe: bool = False,
     ) -> "HookManager":
         """
         注册钩子
@@ -76,6 +93,8 @@ class HookManager:
             name: 钩子名称
             func: 钩子函数
             priority: 优先级
+            concurrent_safe: 是否可与同优先级的其他 concurrent_safe 异步钩子并发执行，
+                默认按注册顺序逐个执行
 
         Returns:
             self
@@ -85,9 +104,11 @@ class HookManager:
             func=func,
             priority=priority,
             hook_type=hook_type,
+            concurrent_safe=concurrent_safe,
         )
-        self._hooks[hook_type].append(entry)
-        logger.debug(f"Hook '{name}' registered for {hook_type.value}")
+        # 插入时保持按优先级从高到低有序，同优先级按注册顺序
+        bisect.insort(self._hooks[hook_type], entry)
+        logger.debug("Hook '%s' registered for %s", name, hook_type.value)
         return self
 
     def register_post_start(
@@ -95,18 +116,24 @@ class HookManager:
         name: str,
         func: Union[HookFunc, AsyncHookFunc],
         priority: int = 0,
+        concurrent_safe: bool = False,
     ) -> "HookManager":
         """注册启动后钩子"""
-        return self.register(HookType.POST_START, name, func, priority)
+        return self.register(
+            HookType.POST_START, name, func, priority, concurrent_safe
+        )
 
     def register_pre_shutdown(
         self,
         name: str,
         func: Union[HookFunc, AsyncHookFunc],
         priority: int = 0,
+        concurrent_safe: bool = False,
     ) -> "HookManager":
         """注册关闭前钩子"""
-        return self.register(HookType.PRE_SHUTDOWN, name, func, priority)
+        return self.register(
+            HookType.PRE_SHUTDOWN, name, func, priority, concurrent_safe
+        )
 
     async def run_hooks(self, hook_type: HookType) -> None:
         """
@@ -119,24 +146,58 @@ class HookManager:
         if not hooks:
             return
 
-        # 按优先级排序（从高到低）
-        sorted_hooks = sorted(hooks, key=lambda h: h.priority, reverse=True)
-
-        for hook in sorted_hooks:
-            try:
-                logger.debug(f"Running hook '{hook.name}' ({hook_type.value})")
+        # 注册时已按优先级排序（从高到低）；同优先级相邻的 concurrent_safe
+        # 异步钩子合并为一批并发执行，其余钩子逐个执行
+        batch: List[HookEntry] = []
+        for hook in hooks:
+            if (
+                hook.concurrent_safe
+                and hook.is_async
+                and (not batch or batch[0].priority == hook.priority)
+            ):
+                batch.append(hook)
+                continue
+            await self._run_batch(batch, hook_type)
+            if hook.concurrent_safe and hook.is_async:
+                batch = [hook]
+            else:
+                batch = []
+                await self._run_batch([hook], hook_type)
+        await self._run_batch(batch, hook_type)
+
+    async def _run_batch(self, batch: List[HookEntry], hook_type: HookType) -> None:
+        """执行一批钩子；启动后钩子失败时在整批结束后抛出第一个错误"""
+        if not batch:
+            return
 
-                if asyncio.iscoroutinefunction(hook.func):
-                    await hook.func()
-                else:
-                    hook.func()
+        if len(batch) == 1:
+            await self._run_hook(batch[0], hook_type)
+            return
 
-                logger.debug(f"Hook '{hook.name}' completed")
-            except Exception as e:
-                logger.error(f"Hook '{hook.name}' failed: {e}")
-                # 根据钩子类型决定是否继续
-                if hook_type == HookType.POST_START:
-                    raise
+        results = await asyncio.gather(
+            *(self._run_hook(hook, hook_type) for hook in batch),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _run_hook(self, hook: HookEntry, hook_type: HookType) -> None:
+        """执行单个钩子"""
+        try:
+            logger.debug("Running hook '%s' (%s)", hook.name, hook_type.value)
+
+            if hook.is_async:
+                await hook.func()
+            else:
+                hook.func()
+
+            logger.debug("Hook '%s' completed", hook.name)
+        except Exception as e:
+            logger.error("Hook '%s' failed: %s", hook.name, e)
+            # 根据钩子类型决定是否继续
+            if hook_type == HookType.POST_START:
+                raise
 
     async def run_post_start_hooks(self) -> None:
         """执行启动后钩子"""
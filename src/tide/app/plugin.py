@@ -8,8 +8,10 @@ Plugin - 插件机制
 提供组件的插件化加载和管理
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 
 if TYPE_CHECKING:
@@ -47,6 +49,10 @@ class Plugin(ABC):
     # 是否启用（可以根据配置动态决定）
     enabled: bool = True
 
+    # 是否可与同优先级、同样声明 concurrent_safe 的插件并发安装；
+    # 默认 False，按注册顺序逐个安装
+    concurrent_safe: bool = False
+
     @abstractmethod
     async def install(self, ctx: "CommandContext") -> None:
         """
@@ -104,10 +110,10 @@ class PluginManager:
             self
         """
         if plugin.name in self._plugins:
-            logger.warning(f"Plugin '{plugin.name}' already registered, overwriting")
+            logger.warning("Plugin '%s' already registered, overwriting", plugin.name)
 
         self._plugins[plugin.name] = plugin
-        logger.debug(f"Plugin '{plugin.name}' registered with priority {plugin.priority}")
+        logger.debug("Plugin '%s' registered with priority %s", plugin.name, plugin.priority)
         return self
 
     def unregister(self, name: str) -> Optional[Plugin]:
@@ -138,7 +144,8 @@ class PluginManager:
         """
         安装所有插件
 
-        按优先级从高到低安装
+        按优先级从高到低安装；同一优先级内按注册顺序安装，其中相邻的
+        concurrent_safe 插件并发安装
 
         Args:
             ctx: 命令上下文
@@ -150,19 +157,55 @@ class PluginManager:
             reverse=True,
         )
 
-        for plugin in sorted_plugins:
-            if not plugin.should_install(ctx):
-                logger.debug(f"Skipping plugin '{plugin.name}' (disabled)")
-                continue
+        for _, group in groupby(sorted_plugins, key=lambda p: p.priority):
+            batch: List[Plugin] = []
+            for plugin in group:
+                if not plugin.should_install(ctx):
+                    logger.debug("Skipping plugin '%s' (disabled)", plugin.name)
+                    continue
+                if plugin.concurrent_safe:
+                    batch.append(plugin)
+                    continue
+                # 未声明可并发的插件单独安装，前面累积的并发批次先完成
+                await self._install_batch(batch, ctx)
+                batch = []
+                await self._install_batch([plugin], ctx)
+            await self._install_batch(batch, ctx)
+
+    async def _install_batch(self, batch: List[Plugin], ctx: "CommandContext") -> None:
+        """并发安装一批插件，全部结束后再抛出第一个错误"""
+        if not batch:
+            return
+
+        if len(batch) == 1:
+            await self._install_plugin(batch[0], ctx)
+            self._installed.append(batch[0].name)
+            return
+
+        results = await asyncio.gather(
+            *(self._install_plugin(plugin, ctx) for plugin in batch),
+            return_exceptions=True,
+        )
 
-            try:
-                logger.info(f"Installing plugin '{plugin.name}'...")
-                await plugin.install(ctx)
+        # 成功的插件按注册顺序记录，保证卸载顺序确定；有失败则抛出第一个错误
+        error: Optional[BaseException] = None
+        for plugin, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                error = error or result
+            else:
                 self._installed.append(plugin.name)
-                logger.info(f"Plugin '{plugin.name}' installed successfully")
-            except Exception as e:
-                logger.error(f"Failed to install plugin '{plugin.name}': {e}")
-                raise
+        if error is not None:
+            raise error
+
+    async def _install_plugin(self, plugin: Plugin, ctx: "CommandContext") -> None:
+        """安装单个插件"""
+        try:
+            logger.info("Installing plugin '%s'...", plugin.name)
+            await plugin.install(ctx)
+            logger.info("Plugin '%s' installed successfully", plugin.name)
+        except Exception as e:
+            logger.error("Failed to install plugin '%s': %s", plugin.name, e)
+            raise
 
     async def uninstall_all(self, ctx: "CommandContext") -> None:
         """
@@ -180,11 +223,11 @@ class PluginManager:
                 continue
 
             try:
-                logger.info(f"Uninstalling plugin '{name}'...")
+                logger.info("Uninstalling plugin '%s'...", name)
                 await plugin.uninstall(ctx)
-                logger.info(f"Plugin '{name}' uninstalled successfully")
+                logger.info("Plugin '%s' uninstalled successfully", name)
             except Exception as e:
-                logger.error(f"Failed to uninstall plugin '{name}': {e}")
+                logger.error("Failed to uninstall plugin '%s': %s", name, e)
                 # 继续卸载其他插件
 
         self._installed.clear()
@@ -10,7 +10,7 @@ Tide CLI
 import os
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import click
 
@@ -37,6 +37,8 @@ def new(name: str, template: str):
         click.echo(f"Error: Directory '{name}' already exists", err=True)
         return
 
+    module_name = name.replace("-", "_")
+
     # 创建目录结构
     dirs = [
         "api",
@@ -51,31 +53,54 @@ def new(name: str, template: str):
         "scripts",
     ]
 
-    for d in dirs:
-        dir_path = project_dir / d.format(name=name.replace("-", "_"))
+    rel_dirs = [d.format(name=module_name) for d in dirs]
+
+    # 去重后从最深的目录开始创建，父目录随之建好，兄弟目录不再重复检查
+    created = set()
+    for dir_path in sorted(
+        {project_dir / d for d in rel_dirs}, key=lambda p: -len(p.parts)
+    ):
+        if dir_path in created:
+            continue
         dir_path.mkdir(parents=True, exist_ok=True)
+        created.update(dir_path.parents)
+
+    # 相对路径 -> 文件内容
+    files = {}
+    for d in rel_dirs:
         # 创建 __init__.py
         if "pkg" in d or "cmd" in d or "web" in d:
-            (dir_path / "__init__.py").write_text('"""Module"""\n')
+            files[f"{d}/__init__.py"] = '"""Module"""\n'
 
     # 创建基础文件
-    _create_pyproject(project_dir, name)
-    _create_readme(project_dir, name)
-    _create_config(project_dir, name)
-    _create_main(project_dir, name)
-    _create_makefile(project_dir, name)
-    _create_gitignore(project_dir)
+    main_dir = f"cmd/{module_name}"
+    files.update({
+        "pyproject.toml": _pyproject_content(name),
+        "README.md": _readme_content(name, module_name),
+        "conf/config.yaml": _config_content(name),
+        f"{main_dir}/main.py": _main_content(name),
+        f"{main_dir}/__init__.py": '"""Main module"""\n',
+        "Makefile": _makefile_content(name, module_name),
+        ".gitignore": _GITIGNORE_CONTENT,
+    })
+    _write_files(project_dir, files)
 
     click.echo(f"✅ Project '{name}' created successfully!")
     click.echo(f"\nNext steps:")
     click.echo(f"  cd {name}")
     click.echo(f"  pip install -e .")
-    click.echo(f"  python cmd/{name.replace('-', '_')}/main.py serve")
+    click.echo(f"  python cmd/{module_name}/main.py serve")
 
 
-def _create_pyproject(project_dir: Path, name: str):
-    """创建 pyproject.toml"""
-    content = f'''[build-system]
+def _write_files(project_dir: Path, files: Dict[str, str]) -> None:
+    """按 UTF-8 写出文件（相对路径 -> 内容），每个文件一次写入"""
+    for rel_path, content in files.items():
+        (project_dir / rel_path).write_bytes(content.encode("utf-8"))
+
+
+def _pyproject_content(name: str) -> str:
+    """生成 pyproject.toml"""
+    return f'''[build-system]
 requires = ["setuptools>=61.0", "wheel"]
 build-backend = "setuptools.build_meta"
 
@@ -101,12 +126,11 @@ package-dir = {{"" = "."}}
 [tool.setuptools.packages.find]
 where = ["."]
 '''
-    (project_dir / "pyproject.toml").write_text(content)
 
 
-def _create_readme(project_dir: Path, name: str):
-    """创建 README.md"""
-    content = f'''# {name}
+def _readme_content(name: str, module_name: str) -> str:
+    """生成 README.md"""
+    return f'''# {name}
 
 Built with [Tide](https://github.com/kaydxh/tide) Framework.
 
@@ -117,7 +141,7 @@ Built with [Tide](https://github.com/kaydxh/tide) Framework.
 pip install -e .
 
 # Run server
-python cmd/{name.replace("-", "_")}/main.py serve --config conf/config.yaml
+python cmd/{module_name}/main.py serve --config conf/config.yaml
 ```
 
 ## Project Structure
@@ -125,8 +149,8 @@ python cmd/{name.replace("-", "_")}/main.py serve --config conf/config.yaml
 ```
 {name}/
 ├── api/                    # Proto/API definitions
-├── cmd/{name.replace("-", "_")}/            # Application entry
-├── pkg/{name.replace("-", "_")}/            # Business logic (DDD)
+├── cmd/{module_name}/            # Application entry
+├── pkg/{module_name}/            # Business logic (DDD)
 │   ├── application/        # Application layer
 │   ├── domain/             # Domain layer
 │   └── infrastructure/     # Infrastructure layer
@@ -135,12 +159,11 @@ python cmd/{name.replace("-", "_")}/main.py serve --config conf/config.yaml
 └── tests/                  # Tests
 ```
 '''
-    (project_dir / "README.md").write_text(content)
 
 
-def _create_config(project_dir: Path, name: str):
-    """创建配置文件"""
-    content = f'''# {name} Configuration
+def _config_content(name: str) -> str:
+    """生成配置文件"""
+    return f'''# {name} Configuration
 
 name: {name}
 version: 0.1.0
@@ -168,13 +191,11 @@ database:
 open_telemetry:
   enabled: false
 '''
-    (project_dir / "conf" / "config.yaml").write_text(content)
 
 
-def _create_main(project_dir: Path, name: str):
-    """创建主入口文件"""
-    module_name = name.replace("-", "_")
-    content = f'''#!/usr/bin/env python3
+def _main_content(name: str) -> str:
+    """生成主入口文件"""
+    return f'''#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
 """
@@ -203,16 +224,11 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-    main_dir = project_dir / "cmd" / module_name
-    main_dir.mkdir(parents=True, exist_ok=True)
-    (main_dir / "main.py").write_text(content)
-    (main_dir / "__init__.py").write_text('"""Main module"""\n')
 
 
-def _create_makefile(project_dir: Path, name: str):
-    """创建 Makefile"""
-    module_name = name.replace("-", "_")
-    content = f'''.PHONY: all build run test clean install
+def _makefile_content(name: str, module_name: str) -> str:
+    """生成 Makefile"""
+    return f'''.PHONY: all build run test clean install
 
 all: build
 
@@ -250,12 +266,10 @@ help:
 \t@echo "  make clean   - Clean build artifacts"
 \t@echo "  make install - Install with dev dependencies"
 '''
-    (project_dir / "Makefile").write_text(content)
 
 
-def _create_gitignore(project_dir: Path):
-    """创建 .gitignore"""
-    content = '''# Python
+# .gitignore 内容
+_GITIGNORE_CONTENT = '''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -302,7 +316,6 @@ log/
 .DS_Store
 Thumbs.db
 '''
-    (project_dir / ".gitignore").write_text(content)
 
 
 @main.command()
@@ -318,8 +331,10 @@ def init():
     for d in dirs:
         Path(d).mkdir(exist_ok=True)
 
-    _create_config(Path("."), name)
-    _create_gitignore(Path("."))
+    _write_files(Path("."), {
+        "conf/config.yaml": _config_content(name),
+        ".gitignore": _GITIGNORE_CONTENT,
+    })
 
     click.echo(f"✅ Tide project initialized in current directory")
 
@@ -10,27 +10,70 @@ Tide Config 模块
 - 配置加载器
 """
 
-from tide.config.config import (
-    TideConfig,
-    WebConfig,
-    NetConfig,
-    GrpcConfig,
-    HttpConfig,
-    LogConfig,
-    DatabaseConfig,
-    MySQLConfig,
-    RedisConfig,
-    OpenTelemetryConfig,
-    DebugConfig,
-    ShutdownConfig,
-    QPSLimitConfig,
-    MethodQPSConfig,
-)
-from tide.config.loader import (
-    load_config,
-    load_config_from_file,
-    ConfigLoader,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tide.config.config import (
+        TideConfig,
+        WebConfig,
+        NetConfig,
+        GrpcConfig,
+        HttpConfig,
+        LogConfig,
+        DatabaseConfig,
+        MySQLConfig,
+        RedisConfig,
+        OpenTelemetryConfig,
+        DebugConfig,
+        ShutdownConfig,
+        QPSLimitConfig,
+        MethodQPSConfig,
+    )
+    from tide.config.loader import (
+        load_config,
+        load_config_from_file,
+        ConfigLoader,
+    )
+
+# 公开名称 -> 所在模块，首次访问时才导入（PEP 562），
+# 只用到配置模型时不会加载 yaml 等加载器依赖
+_LAZY_IMPORTS = {
+    "TideConfig": "tide.config.config",
+    "WebConfig": "tide.config.config",
+    "NetConfig": "tide.config.config",
+    "GrpcConfig": "tide.config.config",
+    "HttpConfig": "tide.config.config",
+    "LogConfig": "tide.config.config",
+    "DatabaseConfig": "tide.config.config",
+    "MySQLConfig": "tide.config.config",
+    "RedisConfig": "tide.config.config",
+    "OpenTelemetryConfig": "tide.config.config",
+    "DebugConfig": "tide.config.config",
+    "ShutdownConfig": "tide.config.config",
+    "QPSLimitConfig": "tide.config.config",
+    "MethodQPSConfig": "tide.config.config",
+    "load_config": "tide.config.loader",
+    "load_config_from_file": "tide.config.loader",
+    "ConfigLoader": "tide.config.loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Main Config
@@ -10,7 +10,21 @@
 import re
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# 时间片段："1h30m" 中的每一段数字加单位；多字符单位放在前面，
+# 避免 "100ms" 被 "m" 先匹配成分钟
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|us|ns|h|m|s)?", re.IGNORECASE)
+
+# 单位 -> 秒数倍率，无单位按秒处理
+_UNIT_SECONDS = {
+    "h": 3600.0,
+    "m": 60.0,
+    "s": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+    "ns": 1e-9,
+}
 
 
 def parse_duration(value: Union[str, int, float, None]) -> float:
@@ -31,6 +45,13 @@ def parse_duration(value: Union[str, int, float, None]) -> float:
     Returns:
         秒数（float）
     """
+    # 配置中多为数字，先走精确类型判断的快路径
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+
     if value is None:
         return 0.0
 
@@ -52,24 +73,8 @@ def parse_duration(value: Union[str, int, float, None]) -> float:
 
     # 解析带单位的时间
     total_seconds = 0.0
-    pattern = r"(\d+(?:\.\d+)?)\s*(h|m|s|ms|us|ns)?"
-
-    for match in re.finditer(pattern, value, re.IGNORECASE):
-        num = float(match.group(1))
-        unit = (match.group(2) or "s").lower()
-
-        if unit == "h":
-            total_seconds += num * 3600
-        elif unit == "m":
-            total_seconds += num * 60
-        elif unit == "s":
-            total_seconds += num
-        elif unit == "ms":
-            total_seconds += num / 1000
-        elif unit == "us":
-            total_seconds += num / 1000000
-        elif unit == "ns":
-            total_seconds += num / 1000000000
+    for num, unit in _DURATION_RE.findall(value):
+        total_seconds += float(num) * _UNIT_SECONDS[unit.lower() or "s"]
 
     return total_seconds
 
@@ -77,13 +82,20 @@ def parse_duration(value: Union[str, int, float, None]) -> float:
 class NetConfig(BaseModel):
     """网络绑定配置"""
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(default="0.0.0.0", description="绑定地址")
     port: int = Field(default=8080, ge=1, le=65535, description="绑定端口")
 
 
+_DEFAULT_NET_CONFIG = NetConfig()
+
+
 class GrpcConfig(BaseModel):
     """gRPC 配置"""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=True, description="是否启用")
     port: int = Field(default=50051, ge=1, le=65535, description="gRPC 端口")
     timeout: float = Field(default=0, ge=0, description="超时时间（秒）")
@@ -100,9 +112,14 @@ class GrpcConfig(BaseModel):
         return parse_duration(v)
 
 
+_DEFAULT_GRPC_CONFIG = GrpcConfig()
+
+
 class HttpConfig(BaseModel):
     """HTTP 配置"""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=True, description="是否启用")
     read_timeout: float = Field(default=0, ge=0, description="读取超时时间（秒）")
     write_timeout: float = Field(default=0, ge=0, description="写入超时时间（秒）")
@@ -117,6 +134,9 @@ class HttpConfig(BaseModel):
         return parse_duration(v)
 
 
+_DEFAULT_HTTP_CONFIG = HttpConfig()
+
+
 class MethodQPSConfig(BaseModel):
     """方法级 QPS 配置"""
 
@@ -147,14 +167,21 @@ class QPSLimitConfig(BaseModel):
 class DebugConfig(BaseModel):
     """调试配置"""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=False, description="是否启用调试")
     enable_profiling: bool = Field(default=False, description="是否启用性能分析")
     profiling_path: str = Field(default="/debug/pprof", description="性能分析路径")
 
 
+_DEFAULT_DEBUG_CONFIG = DebugConfig()
+
+
 class ShutdownConfig(BaseModel):
     """关闭配置"""
 
+    model_config = ConfigDict(frozen=True)
+
     delay_duration: float = Field(default=0, ge=0, description="关闭延迟时间（秒）")
     timeout_duration: float = Field(default=5.0, ge=0, description="关闭超时时间（秒）")
 
@@ -164,15 +191,27 @@ class ShutdownConfig(BaseModel):
         return parse_duration(v)
 
 
+_DEFAULT_SHUTDOWN_CONFIG = ShutdownConfig()
+
+
 class WebConfig(BaseModel):
     """Web 服务器配置"""
 
-    bind_address: NetConfig = Field(default_factory=NetConfig, description="绑定地址")
-    grpc: GrpcConfig = Field(default_factory=GrpcConfig, description="gRPC 配置")
-    http: HttpConfig = Field(default_factory=HttpConfig, description="HTTP 配置")
-    debug: DebugConfig = Field(default_factory=DebugConfig, description="调试配置")
+    # 叶子配置不可变，未配置时直接共享模块级默认实例，不再逐个构造和校验
+    bind_address: NetConfig = Field(
+        default_factory=lambda: _DEFAULT_NET_CONFIG, description="绑定地址"
+    )
+    grpc: GrpcConfig = Field(
+        default_factory=lambda: _DEFAULT_GRPC_CONFIG, description="gRPC 配置"
+    )
+    http: HttpConfig = Field(
+        default_factory=lambda: _DEFAULT_HTTP_CONFIG, description="HTTP 配置"
+    )
+    debug: DebugConfig = Field(
+        default_factory=lambda: _DEFAULT_DEBUG_CONFIG, description="调试配置"
+    )
     shutdown: ShutdownConfig = Field(
-        default_factory=ShutdownConfig, description="关闭配置"
+        default_factory=lambda: _DEFAULT_SHUTDOWN_CONFIG, description="关闭配置"
     )
     http_qps_limit: Optional[QPSLimitConfig] = Field(
         default=None, description="HTTP QPS 限流配置"
@@ -236,6 +275,9 @@ class RedisConfig(BaseModel):
     dial_timeout: float = Field(default=5, ge=0, description="连接超时（秒）")
     read_timeout: float = Field(default=3, ge=0, description="读取超时（秒）")
     write_timeout: float = Field(default=3, ge=0, description="写入超时（秒）")
+    pool_timeout: float = Field(
+        default=5, gt=0, description="连接池耗尽时等待空闲连接的超时（秒）"
+    )
 
 
 class DatabaseConfig(BaseModel):
@@ -7,21 +7,120 @@
 参考 Go 版本 sea 的 viper 配置加载实现
 """
 
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
 
 import yaml
 from pydantic import BaseModel
 
+try:
+    # orjson 直接从 bytes 解码，缓存命中时省去 decode 和标准库解析
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from tide.config.config import TideConfig
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 libyaml 实现的 C 加载器，未编译 libyaml 时回退到纯 Python 实现
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 设置 TIDE_CONFIG_CACHE=1 后，解析后的配置以 JSON 缓存在此目录，
+# 重启时跳过 YAML 解析；默认关闭，不在用户目录写文件
+_CONFIG_CACHE_ENABLED = os.environ.get("TIDE_CONFIG_CACHE") == "1"
+_CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tide"
+)
+
+# 环境变量值分类：布尔字面量查集合，常见数字写法用正则判定后直接转换
+_BOOL_TRUE = frozenset(("true", "yes", "1", "on"))
+_BOOL_FALSE = frozenset(("false", "no", "0", "off"))
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点分隔的配置键，结果缓存供重复读取复用"""
+    return tuple(key.split("."))
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """解析 YAML 配置文件"""
+    # libyaml 直接读取字节流，省去文本解码
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def _has_only_str_keys(value: Any) -> bool:
+    """检查所有映射的键是否均为 str（JSON 会把其他类型的键转成字符串）"""
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, str) and _has_only_str_keys(v) for k, v in value.items()
+        )
+    if isinstance(value, list):
+        return all(_has_only_str_keys(v) for v in value)
+    return True
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """
+    解析 YAML 配置文件，文件未变化时复用 JSON 缓存
+
+    缓存按文件绝对路径、mtime 和大小区分，配置文件任何修改都会使其失效
+    """
+    stat = path.stat()
+    prefix = hashlib.md5(str(path.resolve()).encode("utf-8")).hexdigest()
+    cache_file = _CONFIG_CACHE_DIR / (
+        f"{path.name}.{prefix}.{stat.st_mtime_ns}-{stat.st_size}.json"
+    )
+
+    try:
+        with open(cache_file, "rb") as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", cache_file, e)
+
+    data = _load_yaml(path)
+
+    # 非字符串键（如 {1: x}）经 JSON 往返后会变成 "1"，此时不缓存
+    if not _has_only_str_keys(data):
+        return data
+
+    try:
+        # YAML 中的日期、.inf/.nan 等无法无损转为 JSON，此时不缓存；
+        # 写入只在缓存失效时发生，用标准库以便对这些值报错而不是静默转换
+        encoded = json.dumps(data, allow_nan=False).encode("utf-8")
+    except (TypeError, ValueError):
+        return data
+
+    try:
+        _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _CONFIG_CACHE_DIR.glob(f"{path.name}.{prefix}.*.json"):
+            stale.unlink()
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Failed to write config cache %s: %s", cache_file, e)
+
+    return data
+
+
 class ConfigLoader:
     """
     配置加载器
@@ -50,8 +149,10 @@ class ConfigLoader:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        if _CONFIG_CACHE_ENABLED:
+            data = _load_yaml_cached(path)
+        else:
+            data = _load_yaml(path)
 
         self._merge_data(self._data, data)
         logger.info(f"Loaded config from {path}")
@@ -74,40 +175,47 @@ class ConfigLoader:
         prefix = prefix or self._env_prefix
         prefix = prefix.upper() + "_"
 
-        for key, value in os.environ.items():
-            if not key.startswith(prefix):
-                continue
+        # 先筛出带前缀的变量，没有时直接返回
+        items = [(k, v) for k, v in os.environ.items() if k.startswith(prefix)]
+        if not items:
+            return self
 
+        prefix_len = len(prefix)
+        for key, value in items:
             # 移除前缀并转换为配置路径
-            config_key = key[len(prefix) :].lower()
-            keys = config_key.split("_")
+            keys = key[prefix_len:].lower().split("_")
 
             # 尝试解析值
             parsed_value = self._parse_env_value(value)
 
             # 设置到配置中
             self._set_nested(self._data, keys, parsed_value)
-            logger.debug(f"Loaded env config: {key}={parsed_value}")
+            logger.debug("Loaded env config: %s=%s", key, parsed_value)
 
         return self
 
     def _parse_env_value(self, value: str) -> Any:
         """解析环境变量值"""
         # 布尔值
-        if value.lower() in ("true", "yes", "1", "on"):
+        lowered = value.lower()
+        if lowered in _BOOL_TRUE:
             return True
-        if value.lower() in ("false", "no", "0", "off"):
+        if lowered in _BOOL_FALSE:
             return False
 
-        # 整数
+        # 整数 / 浮点数
+        stripped = value.strip()
+        if _INT_RE.fullmatch(stripped):
+            return int(stripped)
+        if _FLOAT_RE.fullmatch(stripped):
+            return float(stripped)
+        # 正则只覆盖常见写法，"1_000"、"inf"、"nan" 等仍交给 int() / float() 判定
         try:
-            return int(value)
+            return int(stripped)
         except ValueError:
             pass
-
-        # 浮点数
         try:
-            return float(value)
+            return float(stripped)
         except ValueError:
             pass
 
@@ -124,16 +232,19 @@ class ConfigLoader:
         data[keys[-1]] = value
 
     def _merge_data(self, base: Dict, override: Dict) -> None:
-        """合并配置数据"""
-        for key, value in override.items():
-            if (
-                key in base
-                and isinstance(base[key], dict)
-                and isinstance(value, dict)
-            ):
-                self._merge_data(base[key], value)
-            else:
-                base[key] = value
+        """合并配置数据
+
+        使用显式栈逐层合并嵌套字典，不受递归深度限制
+        """
+        stack = [(base, override)]
+        while stack:
+            base_dict, override_dict = stack.pop()
+            for key, value in override_dict.items():
+                base_value = base_dict.get(key)
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    stack.append((base_value, value))
+                else:
+                    base_dict[key] = value
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -146,19 +257,15 @@ class ConfigLoader:
         Returns:
             配置值
         """
-        keys = key.split(".")
         value = self._data
+        try:
+            for k in _split_key(key):
+                value = value[k]
+        except (KeyError, TypeError):
+            # 键不存在，或中途遇到 None / 非字典节点
+            return default
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-
-            if value is None:
-                return default
-
-        return value
+        return default if value is None else value
 
     def to_model(self, model_class: Type[T] = TideConfig) -> T:
         """
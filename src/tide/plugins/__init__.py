@@ -13,12 +13,45 @@
 - MonitorPlugin: 进程资源监控插件
 """
 
-from tide.plugins.log import LogPlugin
-from tide.plugins.mysql import MySQLPlugin
-from tide.plugins.redis import RedisPlugin
-from tide.plugins.opentelemetry import OpenTelemetryPlugin
-from tide.plugins.webserver import WebServerPlugin
-from tide.plugins.monitor import MonitorPlugin, MonitorConfig
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tide.plugins.log import LogPlugin
+    from tide.plugins.mysql import MySQLPlugin
+    from tide.plugins.redis import RedisPlugin
+    from tide.plugins.opentelemetry import OpenTelemetryPlugin
+    from tide.plugins.webserver import WebServerPlugin
+    from tide.plugins.monitor import MonitorPlugin, MonitorConfig
+
+# 公开名称 -> 所在模块，首次访问时才导入（PEP 562），
+# 只用到其中一个插件时不会加载 SQLAlchemy、redis、opentelemetry 等依赖
+_LAZY_IMPORTS = {
+    "LogPlugin": "tide.plugins.log",
+    "MySQLPlugin": "tide.plugins.mysql",
+    "RedisPlugin": "tide.plugins.redis",
+    "OpenTelemetryPlugin": "tide.plugins.opentelemetry",
+    "WebServerPlugin": "tide.plugins.webserver",
+    "MonitorPlugin": "tide.plugins.monitor",
+    "MonitorConfig": "tide.plugins.monitor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "LogPlugin",
@@ -7,17 +7,69 @@
 参考 Go 版本 sea 的 plugin.logs.go 实现
 """
 
+import json
 import logging
 import sys
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 from tide.app.plugin import Plugin
 
+try:
+    # orjson 由 C 扩展编码，逐条日志序列化时明显快于标准库 json
+    import orjson
+
+    def _json_dumps(obj: Dict[str, Any]) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # 孤立代理字符等 orjson 拒绝的内容交给标准库处理
+            return json.dumps(obj, ensure_ascii=False)
+except ImportError:
+    def _json_dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
 if TYPE_CHECKING:
     from tide.app.command import CommandContext
 
 logger = logging.getLogger(__name__)
 
+class _JsonFormatter(logging.Formatter):
+    """JSON 格式的日志格式化器"""
+
+    def __init__(self, report_caller: bool = False):
+        super().__init__()
+        self._report_caller = report_caller
+        # (整秒, 格式化后的时间前缀)，同一秒内的日志复用 strftime 结果
+        self._second_prefix: Tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """与 formatTime 默认输出一致（"%Y-%m-%d %H:%M:%S,mmm"）"""
+        second = int(record.created)
+        cached = self._second_prefix
+        if cached[0] != second:
+            cached = (
+                second,
+                time.strftime("%Y-%m-%d %H:%M:%S", self.converter(record.created)),
+            )
+            self._second_prefix = cached
+        return "%s,%03d" % (cached[1], record.msecs)
+
+    def format(self, record):
+        log_obj = {
+            "timestamp": self._format_timestamp(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log_obj["exception"] = self.formatException(record.exc_info)
+        if self._report_caller:
+            log_obj["file"] = record.filename
+            log_obj["line"] = record.lineno
+            log_obj["function"] = record.funcName
+        return _json_dumps(log_obj)
+
 
 class LogPlugin(Plugin):
     """
@@ -37,44 +89,16 @@ class LogPlugin(Plugin):
 
         log_config = config.log
 
-        # 配置日志级别
-        level_map = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "warn": logging.WARNING,
-            "error": logging.ERROR,
-            "critical": logging.CRITICAL,
-        }
-        level = level_map.get(log_config.level.lower(), logging.INFO)
+        # 配置日志级别：直接使用 logging 自身的级别名表（含 WARN 等别名），
+        # 未知名称返回 "Level xxx" 字符串，此时回退到 INFO
+        level = logging.getLevelName(log_config.level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
 
         # 配置日志格式
         if log_config.format.lower() == "json":
             # JSON 格式
-            try:
-                import json
-
-                class JsonFormatter(logging.Formatter):
-                    def format(self, record):
-                        log_obj = {
-                            "timestamp": self.formatTime(record),
-                            "level": record.levelname,
-                            "logger": record.name,
-                            "message": record.getMessage(),
-                        }
-                        if record.exc_info:
-                            log_obj["exception"] = self.formatException(record.exc_info)
-                        if log_config.report_caller:
-                            log_obj["file"] = record.filename
-                            log_obj["line"] = record.lineno
-                            log_obj["function"] = record.funcName
-                        return json.dumps(log_obj, ensure_ascii=False)
-
-                formatter = JsonFormatter()
-            except Exception:
-                formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                )
+            formatter = _JsonFormatter(report_caller=log_config.report_caller)
         else:
             # 文本格式
             fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
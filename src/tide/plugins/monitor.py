@@ -13,9 +13,15 @@ Monitor 插件 - 进程资源监控
 该插件可被 tide 下所有 cmd 应用复用。
 """
 
+import asyncio
+import dataclasses
+import functools
+import importlib.util
 import logging
+import sys
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 from tide.app.plugin import Plugin
 
@@ -24,8 +30,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """dataclass 字段名集合，每个类只计算一次"""
+    return frozenset(f.name for f in dataclasses.fields(cls))
+
+
+@dataclass(**_SLOTS)
 class MonitorConfig:
     """进程监控配置。
 
@@ -55,19 +70,57 @@ class MonitorConfig:
         Returns:
             MonitorConfig 实例
         """
-        return cls(
-            enabled=data.get("enabled", False),
-            auto_start=data.get("auto_start", False),
-            interval=data.get("interval", 5.0),
-            enable_gpu=data.get("enable_gpu", True),
-            include_children=data.get("include_children", True),
-            history_size=data.get("history_size", 3600),
-        )
+        # 未配置的字段使用 dataclass 默认值，未知键忽略
+        names = _field_names(cls)
+        return cls(**{k: v for k, v in data.items() if k in names})
 
 
 # 全局 MonitorService 实例
 _monitor_service = None
 
+# 只查找模块位置、不执行导入，开销很小
+_HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+# (MonitorService, MonitorServiceConfig, register_monitor_routes)，首次安装时导入
+_peek_monitor: Optional[Tuple[type, type, Callable]] = None
+_peek_monitor_lock = threading.Lock()
+
+
+def _ensure_peek_loaded() -> Optional[Tuple[type, type, Callable]]:
+    """导入 peek 监控模块并缓存，依赖缺失时返回 None。"""
+    global _peek_monitor
+
+    if _peek_monitor is not None:
+        return _peek_monitor
+
+    with _peek_monitor_lock:
+        if _peek_monitor is None:
+            if not _HAS_PSUTIL:
+                logger.error(
+                    "psutil 未安装，监控插件需要 psutil。请运行: pip install psutil"
+                )
+                return None
+
+            try:
+                from peek.os.monitor.service import (
+                    MonitorService,
+                    MonitorServiceConfig,
+                    register_monitor_routes,
+                )
+            except ImportError:
+                logger.error(
+                    "peek.os.monitor.service 模块未安装，监控插件需要 peek 库"
+                )
+                return None
+
+            _peek_monitor = (
+                MonitorService,
+                MonitorServiceConfig,
+                register_monitor_routes,
+            )
+
+    return _peek_monitor
+
 
 def get_monitor_service():
     """获取全局 MonitorService 实例。
@@ -158,25 +211,10 @@ async def install_monitor(
 
     try:
         # 检查依赖
-        try:
-            import psutil  # noqa: F401
-        except ImportError:
-            logger.error(
-                "psutil 未安装，监控插件需要 psutil。请运行: pip install psutil"
-            )
-            return None
-
-        try:
-            from peek.os.monitor.service import (
-                MonitorService,
-                MonitorServiceConfig,
-                register_monitor_routes,
-            )
-        except ImportError:
-            logger.error(
-                "peek.os.monitor.service 模块未安装，监控插件需要 peek 库"
-            )
+        peek_monitor = _ensure_peek_loaded()
+        if peek_monitor is None:
             return None
+        MonitorService, MonitorServiceConfig, register_monitor_routes = peek_monitor
 
         # 将 tide MonitorConfig 转换为 peek MonitorServiceConfig
         service_config = MonitorServiceConfig(
@@ -188,8 +226,8 @@ async def install_monitor(
             history_size=config.history_size,
         )
 
-        # 创建监控服务
-        service = MonitorService(service_config)
+        # 创建监控服务（会探测 GPU 等，放到线程中执行，不阻塞事件循环）
+        service = await asyncio.to_thread(MonitorService, service_config)
         _monitor_service = service
 
         # 注册 API 路由
@@ -12,6 +12,14 @@ from typing import TYPE_CHECKING, Optional
 
 from tide.app.plugin import Plugin
 
+try:
+    # 在模块导入时加载，避免首次 install 时在事件循环中执行耗时的导入
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    _HAS_SQLALCHEMY = True
+except ImportError:
+    _HAS_SQLALCHEMY = False
+
 if TYPE_CHECKING:
     from tide.app.command import CommandContext
 
@@ -27,6 +35,8 @@ class MySQLPlugin(Plugin):
 
     name = "mysql"
     priority = 80
+    # 只建立自己的连接，可与同优先级的其他数据库插件并发安装
+    concurrent_safe = True
 
     def __init__(self):
         self._engine = None
@@ -39,9 +49,7 @@ class MySQLPlugin(Plugin):
 
     async def install(self, ctx: "CommandContext") -> None:
         """安装 MySQL 插件"""
-        try:
-            from sqlalchemy.ext.asyncio import create_async_engine
-        except ImportError:
+        if not _HAS_SQLALCHEMY:
             logger.warning("SQLAlchemy not installed, skipping MySQL plugin")
             return
 
@@ -59,26 +59,27 @@ class OpenTelemetryPlugin(Plugin):
 
         # 配置 Tracer
         if config.trace_enabled:
-            self._tracer_provider = TracerProvider(resource=resource)
-
-            # 配置导出器
+            # 先构建 span processor，再一次性挂到 TracerProvider 上
+            span_processors = []
             try:
                 if config.trace_exporter_type == "otlp":
                     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
                     from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
                     exporter = OTLPSpanExporter(endpoint=config.trace_endpoint)
-                    self._tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+                    span_processors.append(BatchSpanProcessor(exporter))
 
                 elif config.trace_exporter_type == "stdout":
                     from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
 
-                    self._tracer_provider.add_span_processor(
-                        SimpleSpanProcessor(ConsoleSpanExporter())
-                    )
+                    span_processors.append(SimpleSpanProcessor(ConsoleSpanExporter()))
             except ImportError as e:
                 logger.warning(f"Trace exporter not available: {e}")
 
+            self._tracer_provider = TracerProvider(resource=resource)
+            for processor in span_processors:
+                self._tracer_provider.add_span_processor(processor)
+
             trace.set_tracer_provider(self._tracer_provider)
             tracer = trace.get_tracer(config.service_name)
             ctx.provider.set_tracer(tracer)
@@ -86,32 +87,23 @@ class OpenTelemetryPlugin(Plugin):
 
         # 配置 Meter
         if config.metric_enabled:
-            self._meter_provider = MeterProvider(resource=resource)
-
-            # 配置导出器
+            # 先构建 metric reader，MeterProvider 只创建一次
+            metric_readers = []
             try:
                 if config.metric_exporter_type == "otlp":
                     from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
                     from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 
                     exporter = OTLPMetricExporter(endpoint=config.metric_endpoint)
-                    reader = PeriodicExportingMetricReader(
+                    metric_readers.append(PeriodicExportingMetricReader(
                         exporter,
                         export_interval_millis=int(config.metric_collect_duration * 1000),
-                    )
-                    self._meter_provider = MeterProvider(
-                        resource=resource,
-                        metric_readers=[reader],
-                    )
+                    ))
 
                 elif config.metric_exporter_type == "prometheus":
                     from opentelemetry.exporter.prometheus import PrometheusMetricReader
 
-                    reader = PrometheusMetricReader()
-                    self._meter_provider = MeterProvider(
-                        resource=resource,
-                        metric_readers=[reader],
-                    )
+                    metric_readers.append(PrometheusMetricReader())
 
                 elif config.metric_exporter_type == "stdout":
                     from opentelemetry.sdk.metrics.export import (
@@ -119,17 +111,18 @@ class OpenTelemetryPlugin(Plugin):
                         PeriodicExportingMetricReader,
                     )
 
-                    reader = PeriodicExportingMetricReader(
+                    metric_readers.append(PeriodicExportingMetricReader(
                         ConsoleMetricExporter(),
                         export_interval_millis=int(config.metric_collect_duration * 1000),
-                    )
-                    self._meter_provider = MeterProvider(
-                        resource=resource,
-                        metric_readers=[reader],
-                    )
+                    ))
             except ImportError as e:
                 logger.warning(f"Metric exporter not available: {e}")
 
+            self._meter_provider = MeterProvider(
+                resource=resource,
+                metric_readers=metric_readers,
+            )
+
             metrics.set_meter_provider(self._meter_provider)
             meter = metrics.get_meter(config.service_name)
             ctx.provider.set_meter(meter)
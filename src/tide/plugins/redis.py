@@ -12,6 +12,14 @@ from typing import TYPE_CHECKING, Optional
 
 from tide.app.plugin import Plugin
 
+try:
+    # 在模块导入时加载（会连带导入解析器等模块），避免首次 install 时在事件循环中导入
+    import redis.asyncio as aioredis
+
+    _HAS_REDIS = True
+except ImportError:
+    _HAS_REDIS = False
+
 if TYPE_CHECKING:
     from tide.app.command import CommandContext
 
@@ -27,9 +35,12 @@ class RedisPlugin(Plugin):
 
     name = "redis"
     priority = 80
+    # 连接池独立，不依赖其他插件，可与 MySQL 插件同时安装
+    concurrent_safe = True
 
     def __init__(self):
         self._client = None
+        self._pool = None
 
     def should_install(self, ctx: "CommandContext") -> bool:
         """检查是否应该安装"""
@@ -39,9 +50,7 @@ class RedisPlugin(Plugin):
 
     async def install(self, ctx: "CommandContext") -> None:
         """安装 Redis 插件"""
-        try:
-            import redis.asyncio as aioredis
-        except ImportError:
+        if not _HAS_REDIS:
             logger.warning("Redis not installed, skipping Redis plugin")
             return
 
@@ -60,17 +69,22 @@ class RedisPlugin(Plugin):
             host = "localhost"
             port = 6379
 
-        # 创建 Redis 客户端
-        self._client = aioredis.Redis(
+        # 创建连接池：连接数达到上限时等待空闲连接（最多 pool_timeout 秒），
+        # 而不是在突发流量下无限新建连接；超时后抛出 ConnectionError
+        self._pool = aioredis.BlockingConnectionPool(
             host=host,
             port=port,
             password=config.password or None,
             db=config.database,
-            max_connections=config.pool_size,
+            max_connections=config.pool_size or 10,
+            timeout=config.pool_timeout,
             socket_timeout=config.read_timeout,
             socket_connect_timeout=config.dial_timeout,
         )
 
+        # 创建 Redis 客户端
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
         # 测试连接
         try:
             await self._client.ping()
@@ -82,9 +96,27 @@ class RedisPlugin(Plugin):
         ctx.provider.set_redis(self._client)
         logger.info(f"Redis plugin installed: {host}:{port}")
 
+    def pipeline(self):
+        """
+        创建非事务 pipeline
+
+        多条命令在一次网络往返中发送，避免逐条 await 串行等待：
+
+            async with plugin.pipeline() as pipe:
+                pipe.get(key1)
+                pipe.get(key2)
+                value1, value2 = await pipe.execute()
+        """
+        if self._client is None:
+            raise RuntimeError("Redis plugin is not installed")
+        return self._client.pipeline(transaction=False)
+
     async def uninstall(self, ctx: "CommandContext") -> None:
         """卸载 Redis 插件"""
         if self._client:
             await self._client.close()
             self._client = None
+            # 外部传入的连接池不会随客户端关闭，需要单独断开
+            await self._pool.disconnect()
+            self._pool = None
             logger.info("Redis plugin uninstalled")
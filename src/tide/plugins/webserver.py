@@ -7,17 +7,78 @@ Web 服务器插件
 基于 peek 的 webserver 模块实现
 """
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
 
 from tide.app.plugin import Plugin
 
+try:
+    # 插件模块按需加载，导入后 install / create_web_server 直接使用
+    from peek.net.webserver import GenericWebServer, WebConfig as PeekWebConfig
+
+    _HAS_PEEK_WEBSERVER = True
+except ImportError:
+    _HAS_PEEK_WEBSERVER = False
+
 if TYPE_CHECKING:
     from tide.app.command import CommandContext
-    from peek.net.webserver import GenericWebServer
 
 logger = logging.getLogger(__name__)
 
+# slots 需要 Python 3.10+，更低版本保留 __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class _ServerConfig:
+    """创建 Web 服务器所需的配置项（已从 dict / dataclass 中取出）"""
+
+    host: str
+    port: int
+    grpc_port: Optional[int]
+    shutdown_delay: float
+    shutdown_timeout: float
+
+
+def _config_value(section: Any, name: str, default: Any) -> Any:
+    """从 dict 或对象形式的配置段中取值"""
+    if isinstance(section, dict):
+        return section.get(name, default)
+    return getattr(section, name, default)
+
+
+def _normalize_web_config(web_config) -> _ServerConfig:
+    """解析 Web 配置，兼容 dict 和 dataclass 两种形式"""
+    bind_address = _config_value(web_config, "bind_address", None) or {}
+    grpc_config = _config_value(web_config, "grpc", None) or {}
+    shutdown_config = _config_value(web_config, "shutdown", None) or {}
+
+    grpc_enabled = _config_value(grpc_config, "enabled", False)
+    return _ServerConfig(
+        host=_config_value(bind_address, "host", "0.0.0.0"),
+        port=_config_value(bind_address, "port", 10001),
+        grpc_port=_config_value(grpc_config, "port", None) if grpc_enabled else None,
+        shutdown_delay=_config_value(shutdown_config, "delay_duration", 0),
+        shutdown_timeout=_config_value(shutdown_config, "timeout_duration", 5.0),
+    )
+
+
+def _default_response_class():
+    """获取默认响应类。
+
+    安装了 orjson 时使用 ORJSONResponse，由 C 扩展一次完成编码并直接返回 bytes；
+    否则返回 None，保持 FastAPI 默认的 JSONResponse。
+    """
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+    except ImportError:
+        return None
+    return ORJSONResponse
+
 
 class WebServerPlugin(Plugin):
     """
@@ -34,11 +95,9 @@ class WebServerPlugin(Plugin):
 
     async def install(self, ctx: "CommandContext") -> None:
         """安装 Web 服务器插件"""
-        try:
-            from peek.net.webserver import GenericWebServer, WebConfig as PeekWebConfig
-        except ImportError:
+        if not _HAS_PEEK_WEBSERVER:
             logger.error("peek.net.webserver not available")
-            raise
+            raise ImportError("peek.net.webserver not available")
 
         config = ctx.config
         web_config = config.web
@@ -103,59 +162,62 @@ async def create_web_server(web_config):
     Returns:
         GenericWebServer instance
     """
-    try:
-        from peek.net.webserver import GenericWebServer
-    except ImportError:
-        logger.error("peek.net.webserver not available, using fallback FastAPI server")
-        return await _create_fallback_server(web_config)
-
     # 获取配置值，处理 dict 和 dataclass 两种情况
-    bind_address = getattr(web_config, 'bind_address', {}) or {}
-    if isinstance(bind_address, dict):
-        host = bind_address.get('host', '0.0.0.0')
-        port = bind_address.get('port', 10001)
-    else:
-        host = getattr(bind_address, 'host', '0.0.0.0')
-        port = getattr(bind_address, 'port', 10001)
-
-    grpc_config = getattr(web_config, 'grpc', {}) or {}
-    shutdown_config = getattr(web_config, 'shutdown', {}) or {}
-
-    # 获取 gRPC 端口
-    if isinstance(grpc_config, dict):
-        grpc_enabled = grpc_config.get('enabled', False)
-        grpc_port = grpc_config.get('port', None) if grpc_enabled else None
-    else:
-        grpc_enabled = getattr(grpc_config, 'enabled', False)
-        grpc_port = getattr(grpc_config, 'port', None) if grpc_enabled else None
-
-    # 获取 shutdown 配置
-    if isinstance(shutdown_config, dict):
-        shutdown_delay = shutdown_config.get('delay_duration', 0)
-        shutdown_timeout = shutdown_config.get('timeout_duration', 5.0)
-    else:
-        shutdown_delay = getattr(shutdown_config, 'delay_duration', 0)
-        shutdown_timeout = getattr(shutdown_config, 'timeout_duration', 5.0)
+    server_config = _normalize_web_config(web_config)
+
+    if not _HAS_PEEK_WEBSERVER:
+        logger.error("peek.net.webserver not available, using fallback FastAPI server")
+        return await _create_fallback_server(server_config)
 
     # 创建服务器 - 使用构造函数参数
     server = GenericWebServer(
-        host=host,
-        port=port,
-        grpc_port=grpc_port,
-        shutdown_delay_duration=shutdown_delay,
-        shutdown_timeout_duration=shutdown_timeout,
+        host=server_config.host,
+        port=server_config.port,
+        grpc_port=server_config.grpc_port,
+        shutdown_delay_duration=server_config.shutdown_delay,
+        shutdown_timeout_duration=server_config.shutdown_timeout,
         title="Tide Date Service",
         description="Tide Date Service API",
         version="1.0.0",
     )
 
+    # 之后注册的路由默认使用 orjson 编码响应
+    response_class = _default_response_class()
+    if response_class is not None:
+        server.app.router.default_response_class = response_class
+
     # 安装限流中间件
     _install_qps_limit_middleware(server, web_config)
 
-    logger.info(f"WebServer created: http://{host}:{port}")
+    logger.info(f"WebServer created: http://{server_config.host}:{server_config.port}")
     return server
 
 
+def request_shutdown(web_server) -> bool:
+    """请求 Web 服务器优雅停止。
+
+    服务器停止接收新连接，并在处理完进行中的请求后让 run() 返回；
+    不会取消运行服务的任务。
+
+    Returns:
+        服务器支持优雅停止时返回 True
+    """
+    shutdown = getattr(web_server, "shutdown", None)
+    if callable(shutdown):
+        result = shutdown()
+        if asyncio.iscoroutine(result):
+            asyncio.ensure_future(result)
+        return True
+
+    # 直接持有 uvicorn.Server 的实现
+    uvicorn_server = getattr(web_server, "server", None)
+    if uvicorn_server is not None and hasattr(uvicorn_server, "should_exit"):
+        uvicorn_server.should_exit = True
+        return True
+
+    return False
+
+
 def _install_qps_limit_middleware(server, web_config):
     """安装 QPS 限流中间件。
 
@@ -175,26 +237,17 @@ def _install_qps_limit_middleware(server, web_config):
 
     # 获取 qps_limit 配置
     qps_limit_config = getattr(web_config, 'qps_limit', {}) or {}
-    if isinstance(qps_limit_config, dict):
-        http_qps_config = qps_limit_config.get('http', {})
-    else:
-        http_qps_config = getattr(qps_limit_config, 'http', {}) or {}
+    http_qps_config = _config_value(qps_limit_config, 'http', {}) or {}
 
     if not http_qps_config:
         logger.debug("No HTTP QPS limit config found, skipping QPS limit middleware")
         return
 
     # 解析配置
-    if isinstance(http_qps_config, dict):
-        default_qps = http_qps_config.get('default_qps', 0)
-        default_burst = http_qps_config.get('default_burst', 0)
-        max_concurrency = http_qps_config.get('max_concurrency', 0)
-        method_qps_list = http_qps_config.get('method_qps', [])
-    else:
-        default_qps = getattr(http_qps_config, 'default_qps', 0)
-        default_burst = getattr(http_qps_config, 'default_burst', 0)
-        max_concurrency = getattr(http_qps_config, 'max_concurrency', 0)
-        method_qps_list = getattr(http_qps_config, 'method_qps', [])
+    default_qps = _config_value(http_qps_config, 'default_qps', 0)
+    default_burst = _config_value(http_qps_config, 'default_burst', 0)
+    max_concurrency = _config_value(http_qps_config, 'max_concurrency', 0)
+    method_qps_list = _config_value(http_qps_config, 'method_qps', [])
 
     # 如果没有配置任何限流参数，跳过
     if default_qps <= 0 and max_concurrency <= 0 and not method_qps_list:
@@ -204,22 +257,13 @@ def _install_qps_limit_middleware(server, web_config):
     # 构建方法级配置
     method_configs = []
     for item in method_qps_list:
-        if isinstance(item, dict):
-            method_configs.append(MethodQPSConfig(
-                method=item.get('method', '*'),
-                path=item.get('path', '/'),
-                qps=item.get('qps', 0),
-                burst=item.get('burst', 0),
-                max_concurrency=item.get('max_concurrency', 0),
-            ))
-        else:
-            method_configs.append(MethodQPSConfig(
-                method=getattr(item, 'method', '*'),
-                path=getattr(item, 'path', '/'),
-                qps=getattr(item, 'qps', 0),
-                burst=getattr(item, 'burst', 0),
-                max_concurrency=getattr(item, 'max_concurrency', 0),
-            ))
+        method_configs.append(MethodQPSConfig(
+            method=_config_value(item, 'method', '*'),
+            path=_config_value(item, 'path', '/'),
+            qps=_config_value(item, 'qps', 0),
+            burst=_config_value(item, 'burst', 0),
+            max_concurrency=_config_value(item, 'max_concurrency', 0),
+        ))
 
     # 创建限流配置
     config = QPSLimitConfig(
@@ -239,28 +283,30 @@ def _install_qps_limit_middleware(server, web_config):
     )
 
 
-async def _create_fallback_server(web_config):
+async def _create_fallback_server(server_config: _ServerConfig):
     """Create fallback FastAPI server when peek is not available."""
     from fastapi import FastAPI, APIRouter
+    from fastapi.middleware.gzip import GZipMiddleware
     import uvicorn
 
-    # 获取配置值
-    bind_address = getattr(web_config, 'bind_address', {}) or {}
-    if isinstance(bind_address, dict):
-        host = bind_address.get('host', '0.0.0.0')
-        port = bind_address.get('port', 10001)
-    else:
-        host = getattr(bind_address, 'host', '0.0.0.0')
-        port = getattr(bind_address, 'port', 10001)
+    host = server_config.host
+    port = server_config.port
 
     class FallbackWebServer:
         """Fallback web server using FastAPI directly."""
 
         def __init__(self):
-            self.app = FastAPI(title="Tide Date Service")
+            response_class = _default_response_class()
+            if response_class is not None:
+                self.app = FastAPI(title="Tide Date Service", default_response_class=response_class)
+            else:
+                self.app = FastAPI(title="Tide Date Service")
+            # 压缩较大的 JSON 响应；小响应不值得压缩的 CPU 开销，低压缩级别兼顾速度
+            self.app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
             self.router = APIRouter()
             self.host = host
             self.port = port
+            self._server: Optional["uvicorn.Server"] = None
 
         def get_router(self):
             """Get the API router."""
@@ -269,14 +315,21 @@ async def _create_fallback_server(web_config):
         async def run(self):
             """Run the server."""
             self.app.include_router(self.router)
+            # 关闭逐请求的 access log，避免每个请求都在事件循环中同步写日志
             config = uvicorn.Config(
                 self.app,
                 host=self.host,
                 port=self.port,
-                log_level="info"
+                log_level="warning",
+                access_log=False,
             )
-            server = uvicorn.Server(config)
-            await server.serve()
+            self._server = uvicorn.Server(config)
+            await self._server.serve()
+
+        def shutdown(self):
+            """Stop accepting connections and let run() return once in-flight requests finish."""
+            if self._server is not None:
+                self._server.should_exit = True
 
     server = FallbackWebServer()
     logger.info(f"Fallback WebServer created: http://{host}:{port}")
@@ -10,7 +10,8 @@ Provider - 全局依赖注入容器
 
 import logging
 import threading
-from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +40,27 @@ class Provider:
         mysql = provider.get("mysql")
     """
 
+    __slots__ = (
+        "_config",
+        "_dependencies",
+        "_mysql",
+        "_redis",
+        "_tracer",
+        "_meter",
+        "_factories",
+        "_lock",
+        "_frozen",
+        "_initialized",
+    )
+
     _instance: Optional["Provider"] = None
-    _lock = threading.Lock()
+    # 类级别的锁只保护单例创建，实例的 _lock 保护工厂创建
+    _instance_lock = threading.Lock()
 
     def __new__(cls) -> "Provider":
         """单例模式"""
         if cls._instance is None:
-            with cls._lock:
+            with cls._instance_lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
                     cls._instance._initialized = False
@@ -56,9 +71,18 @@ class Provider:
             return
 
         self._config: Optional[Any] = None
+        # 依赖快照：发布后不再修改，写操作在锁内复制并整体替换，读操作无需加锁
         self._dependencies: Dict[str, Any] = {}
+        # 常用依赖直接缓存为属性，随快照一起更新；
+        # 为 None 时（如通过工厂注册、尚未创建）回退到 get()
+        self._mysql: Optional[Any] = None
+        self._redis: Optional[Any] = None
+        self._tracer: Optional[Any] = None
+        self._meter: Optional[Any] = None
         self._factories: Dict[str, Callable[[], Any]] = {}
         self._lock = threading.Lock()
+        # 启动完成后 freeze()，之后的写操作直接报错，直到 unfreeze() / clear()
+        self._frozen = False
         self._initialized = True
 
     def set_config(self, config: Any) -> None:
@@ -96,16 +120,35 @@ class Provider:
 
         Returns:
             self
+
+        Raises:
+            RuntimeError: Provider 已冻结
         """
         with self._lock:
+            self._check_writable()
             if name in self._dependencies and not overwrite:
                 logger.warning(f"Dependency '{name}' already exists, skipping")
                 return self
 
-            self._dependencies[name] = instance
+            dependencies = dict(self._dependencies)
+            dependencies[name] = instance
+            self._publish(dependencies)
             logger.debug(f"Registered dependency: {name}")
         return self
 
+    def _check_writable(self) -> None:
+        """冻结后拒绝写操作（调用方需持有锁）"""
+        if self._frozen:
+            raise RuntimeError("Provider is frozen, dependencies can not be modified")
+
+    def _publish(self, dependencies: Dict[str, Any]) -> None:
+        """发布新的依赖快照（调用方需持有锁）"""
+        self._dependencies = dependencies
+        self._mysql = dependencies.get("mysql")
+        self._redis = dependencies.get("redis")
+        self._tracer = dependencies.get("tracer")
+        self._meter = dependencies.get("meter")
+
     def register_factory(
         self,
         name: str,
@@ -122,8 +165,12 @@ class Provider:
 
         Returns:
             self
+
+        Raises:
+            RuntimeError: Provider 已冻结
         """
         with self._lock:
+            self._check_writable()
             self._factories[name] = factory
             logger.debug(f"Registered factory: {name}")
         return self
@@ -139,18 +186,22 @@ class Provider:
         Returns:
             依赖实例
         """
-        # 先查找已创建的实例
-        if name in self._dependencies:
-            return self._dependencies[name]
+        # 先查找已创建的实例（读取当前快照，无需加锁）
+        dependencies = self._dependencies
+        if name in dependencies:
+            return dependencies[name]
 
         # 尝试使用工厂创建
         if name in self._factories:
             with self._lock:
                 # 双重检查
-                if name not in self._dependencies:
-                    self._dependencies[name] = self._factories[name]()
+                dependencies = self._dependencies
+                if name not in dependencies:
+                    dependencies = dict(dependencies)
+                    dependencies[name] = self._factories[name]()
+                    self._publish(dependencies)
                     logger.debug(f"Created dependency from factory: {name}")
-                return self._dependencies[name]
+                return dependencies[name]
 
         return default
 
@@ -179,9 +230,15 @@ class Provider:
 
         Returns:
             被移除的依赖
+
+        Raises:
+            RuntimeError: Provider 已冻结
         """
         with self._lock:
-            instance = self._dependencies.pop(name, None)
+            self._check_writable()
+            dependencies = dict(self._dependencies)
+            instance = dependencies.pop(name, None)
+            self._publish(dependencies)
             self._factories.pop(name, None)
             if instance:
                 logger.debug(f"Unregistered dependency: {name}")
@@ -200,17 +257,40 @@ class Provider:
         return name in self._dependencies or name in self._factories
 
     def clear(self) -> None:
-        """清除所有依赖"""
+        """清除所有依赖，并解除冻结"""
         with self._lock:
-            self._dependencies.clear()
+            self._publish({})
             self._factories.clear()
             self._config = None
+            self._frozen = False
             logger.debug("Provider cleared")
 
+    def freeze(self) -> None:
+        """
+        冻结依赖注册
+
+        启动完成后调用，之后 register / register_factory / unregister 会抛出
+        RuntimeError；已注册的工厂仍可在首次 get() 时创建实例
+        """
+        with self._lock:
+            self._frozen = True
+        logger.debug("Provider frozen")
+
+    def unfreeze(self) -> None:
+        """解除冻结，重新允许注册依赖（如应用停止后在同一进程中再次启动）"""
+        with self._lock:
+            self._frozen = False
+        logger.debug("Provider unfrozen")
+
+    @property
+    def frozen(self) -> bool:
+        """是否已冻结"""
+        return self._frozen
+
     @property
-    def dependencies(self) -> Dict[str, Any]:
-        """获取所有依赖"""
-        return self._dependencies.copy()
+    def dependencies(self) -> Mapping[str, Any]:
+        """获取所有依赖（当前快照的只读视图）"""
+        return MappingProxyType(self._dependencies)
 
     # 常用依赖的快捷方法
 
@@ -220,7 +300,8 @@ class Provider:
 
     def get_mysql(self) -> Optional[Any]:
         """获取 MySQL 客户端"""
-        return self.get("mysql")
+        mysql = self._mysql
+        return mysql if mysql is not None else self.get("mysql")
 
     def set_redis(self, client: Any) -> None:
         """设置 Redis 客户端"""
@@ -228,7 +309,13 @@ class Provider:
 
     def get_redis(self) -> Optional[Any]:
         """获取 Redis 客户端"""
-        return self.get("redis")
+        redis = self._redis
+        return redis if redis is not None else self.get("redis")
+
+    def get_redis_pipeline(self) -> Optional[Any]:
+        """获取非事务 Redis pipeline，一次往返发送多条命令；未设置 Redis 时返回 None"""
+        redis = self.get_redis()
+        return redis.pipeline(transaction=False) if redis is not None else None
 
     def set_tracer(self, tracer: Any) -> None:
         """设置 Tracer"""
@@ -236,7 +323,8 @@ class Provider:
 
     def get_tracer(self) -> Optional[Any]:
         """获取 Tracer"""
-        return self.get("tracer")
+        tracer = self._tracer
+        return tracer if tracer is not None else self.get("tracer")
 
     def set_meter(self, meter: Any) -> None:
         """设置 Meter"""
@@ -244,7 +332,8 @@ class Provider:
 
     def get_meter(self) -> Optional[Any]:
         """获取 Meter"""
-        return self.get("meter")
+        meter = self._meter
+        return meter if meter is not None else self.get("meter")
 
 
 # 全局单例获取函数
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""测试公共配置：未安装包时从 src 目录导入 tide"""
+
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
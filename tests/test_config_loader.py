@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""ConfigLoader 环境变量解析测试"""
+
+import math
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from tide.config.loader import ConfigLoader  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("true", True),
+        ("Off", False),
+        ("42", 42),
+        (" -7 ", -7),
+        ("1.5", 1.5),
+        ("1e3", 1000.0),
+        ("1_000", 1000),
+        ("1_000.5", 1000.5),
+        ("inf", math.inf),
+        ("-Infinity", -math.inf),
+        ("a,b", ["a", "b"]),
+        ("hello", "hello"),
+    ],
+)
+def test_parse_env_value(raw, expected):
+    assert ConfigLoader()._parse_env_value(raw) == expected
+
+
+def test_parse_env_value_nan():
+    value = ConfigLoader()._parse_env_value("nan")
+    assert isinstance(value, float) and math.isnan(value)
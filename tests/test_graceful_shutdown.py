@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""tide-date 收到 SIGTERM 时的优雅停止测试"""
+
+import asyncio
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("uvicorn")
+httpx = pytest.importorskip("httpx")
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / "cmd" / "tide-date"))
+
+from app.options.options import ServerRunOptions  # noqa: E402
+from tide.plugins.webserver import _ServerConfig, _create_fallback_server  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="需要 loop.add_signal_handler")
+async def test_sigterm_lets_in_flight_request_complete():
+    port = _free_port()
+    web_server = await _create_fallback_server(
+        _ServerConfig(
+            host="127.0.0.1",
+            port=port,
+            grpc_port=None,
+            shutdown_delay=0,
+            shutdown_timeout=5.0,
+        )
+    )
+
+    request_started = asyncio.Event()
+
+    async def slow():
+        request_started.set()
+        await asyncio.sleep(0.5)
+        return {"done": True}
+
+    web_server.get_router().add_api_route("/slow", slow, methods=["GET"])
+
+    completed = ServerRunOptions(config_file="unused.yaml", load_on_init=False).complete()
+
+    async def serve():
+        completed._web_server = web_server
+        completed._install_signal_handlers()
+        await web_server.run()
+
+    serve_task = asyncio.create_task(serve())
+    loop = asyncio.get_running_loop()
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+            for _ in range(100):
+                try:
+                    await client.get("/docs")
+                    break
+                except httpx.ConnectError:
+                    await asyncio.sleep(0.05)
+
+            request = asyncio.create_task(client.get("/slow"))
+            await asyncio.wait_for(request_started.wait(), timeout=5)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+            response = await asyncio.wait_for(request, timeout=5)
+
+        assert response.status_code == 200
+        assert response.json() == {"done": True}
+        # 处理完进行中的请求后服务自行退出，而不是被取消
+        await asyncio.wait_for(serve_task, timeout=5)
+        assert not serve_task.cancelled()
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
+        if not serve_task.done():
+            serve_task.cancel()
@@ -6,9 +6,10 @@ Similar to sea's web/modules/seadate package.
 """
 
 from .controller import DateController
-from .error import api_error
+from .error import api_error, api_error_dict
 
 __all__ = [
     "DateController",
     "api_error",
+    "api_error_dict",
 ]
@@ -11,7 +11,9 @@ Similar to sea's date.controller.go and date.router.go
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from fastapi.responses import JSONResponse
 
 from api.protoapi_spec.tide_date.v1 import (
     NowRequest,
@@ -19,17 +21,48 @@ from api.protoapi_spec.tide_date.v1 import (
     NowErrorRequest,
     NowErrorResponse,
 )
+from api.protoapi_spec.tide_date.v1.models import (
+    DATE_ALIAS,
+    ERROR_ALIAS,
+    REQUEST_ID_ALIAS,
+)
 from pkg.tide_date.domain.date import (
     NowRequest as DomainNowRequest,
     NowErrorRequest as DomainNowErrorRequest,
 )
-from .error import api_error
+from .error import api_error_dict
 
 if TYPE_CHECKING:
     from pkg.tide_date.application import Application
 
 logger = logging.getLogger(__name__)
 
+# Shared defaults for body-less requests; handlers only read request_id
+_EMPTY_NOW_REQUEST = NowRequest()
+_EMPTY_NOW_ERROR_REQUEST = NowErrorRequest()
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    _ResponseClass = JSONResponse
+
+
+def _date_response(
+    request_id: str, date: str = "", error: Optional[Dict[str, Any]] = None
+) -> JSONResponse:
+    """Render a Now/NowError response body directly.
+
+    Returning a Response makes FastAPI skip the response_model
+    dump/validate/serialize round trip; the keys match the by-alias
+    output of NowResponse and NowErrorResponse.
+    """
+    return _ResponseClass({
+        REQUEST_ID_ALIAS: request_id,
+        DATE_ALIAS: date,
+        ERROR_ALIAS: error,
+    })
+
 
 class DateController:
     """Date service controller.
@@ -39,12 +72,17 @@ class DateController:
     Handles HTTP routes and calls application layer handlers.
     """
 
+    __slots__ = ("_app", "_tide_date_handler")
+
     def __init__(self, app: "Application"):
         """Initialize controller.
 
         Similar to sea's NewController function.
         """
         self._app = app
+        # Handlers are fixed once the application is wired; resolve once
+        # instead of walking app.commands on every request.
+        self._tide_date_handler = app.commands.tide_date_handler
 
     def register_routes(self, web_server):
         """Register routes to web server.
@@ -63,63 +101,63 @@ class DateController:
                 raise AttributeError("web_server must have 'app' or 'router' attribute")
             app = router
 
-        @app.get("/Now")
-        @app.post("/Now")
-        async def now(request: NowRequest = None):
-            """Get current date/time.
-
-            curl -X POST http://localhost:10001/Now \
-              -H "Content-Type: application/json" \
-              -d '{"RequestId": "test-123"}'
-            """
-            return await self.now(request or NowRequest())
-
-        @app.get("/NowError")
-        @app.post("/NowError")
-        async def now_error(request: NowErrorRequest = None):
-            """Get current date/time with error."""
-            return await self.now_error(request or NowErrorRequest())
+        # response_model 仅用于 OpenAPI 文档，处理函数直接返回编码好的响应；
+        # 直接注册绑定方法，请求路径上不再多一层闭包调用
+        # GET 和 POST 分开注册，各自生成唯一的 OpenAPI operationId
+        for method in ("GET", "POST"):
+            app.add_api_route(
+                "/Now",
+                self.now,
+                methods=[method],
+                response_model=NowResponse,
+                response_class=_ResponseClass,
+                operation_id=f"now_{method.lower()}",
+            )
+            app.add_api_route(
+                "/NowError",
+                self.now_error,
+                methods=[method],
+                response_model=NowErrorResponse,
+                response_class=_ResponseClass,
+                operation_id=f"now_error_{method.lower()}",
+            )
 
-    async def now(self, req: NowRequest) -> NowResponse:
+    async def now(self, request: Optional[NowRequest] = None) -> JSONResponse:
         """Handle Now request.
 
         Similar to sea's Controller.Now method.
+
+        curl -X POST http://localhost:10001/Now \
+          -H "Content-Type: application/json" \
+          -d '{"RequestId": "test-123"}'
         """
+        req = request or _EMPTY_NOW_REQUEST
         try:
             domain_req = DomainNowRequest(request_id=req.request_id)
-            domain_resp = await self._app.commands.tide_date_handler.now(domain_req)
+            domain_resp = await self._tide_date_handler.now(domain_req)
 
-            return NowResponse(
-                request_id=req.request_id,
-                date=domain_resp.date,
-            )
+            # 响应字段均由服务端生成，直接编码为 NowResponse 的 JSON 形式
+            return _date_response(req.request_id, domain_resp.date)
 
         except Exception as e:
-            logger.error(f"failed to run [Now] command: {e}")
-            return NowResponse(
-                request_id=req.request_id,
-                error=api_error(e),
-            )
+            logger.error("failed to run [Now] command: %s", e)
+            return _date_response(req.request_id, error=api_error_dict(e))
 
-    async def now_error(self, req: NowErrorRequest) -> NowErrorResponse:
+    async def now_error(
+        self, request: Optional[NowErrorRequest] = None
+    ) -> JSONResponse:
         """Handle NowError request.
 
         Similar to sea's Controller.NowError method.
         """
+        req = request or _EMPTY_NOW_ERROR_REQUEST
         try:
             domain_req = DomainNowErrorRequest(request_id=req.request_id)
-            domain_resp = await self._app.commands.tide_date_handler.now_error(
-                domain_req
-            )
+            domain_resp = await self._tide_date_handler.now_error(domain_req)
 
-            return NowErrorResponse(
-                request_id=req.request_id,
-                date=domain_resp.date,
-            )
+            # 响应字段均由服务端生成，直接编码为 NowErrorResponse 的 JSON 形式
+            return _date_response(req.request_id, domain_resp.date)
 
         except Exception as e:
-            logger.error(f"failed to run [NowError] command: {e}")
-            return NowErrorResponse(
-                request_id=req.request_id,
-                error=api_error(e),
-            )
+            logger.error("failed to run [NowError] command: %s", e)
+            return _date_response(req.request_id, error=api_error_dict(e))
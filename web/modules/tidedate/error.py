@@ -10,18 +10,35 @@ Controller Error Handling
 Similar to sea's date.controller.error.go
 """
 
-from typing import Union
+from typing import Any, Dict
 
 from api.protoapi_spec.tide_date.v1 import Error
 
+_INTERNAL_ERROR_CODE = 500
+_INTERNAL_ERROR_REASON = "Internal Server Error"
+
 
 def api_error(err: Exception) -> Error:
     """Convert exception to API error.
 
     Similar to sea's APIError function.
     """
-    return Error(
-        code=500,
+    # 字段均为服务端生成的可信数据，无需校验
+    return Error.model_construct(
+        code=_INTERNAL_ERROR_CODE,
         message=str(err),
-        reason="Internal Server Error",
+        reason=_INTERNAL_ERROR_REASON,
     )
+
+
+def api_error_dict(err: Exception) -> Dict[str, Any]:
+    """Convert exception to the dumped form of api_error(err).
+
+    Used when the response body is encoded directly, so no Error model
+    is built only to be dumped again.
+    """
+    return {
+        "code": _INTERNAL_ERROR_CODE,
+        "message": str(err),
+        "reason": _INTERNAL_ERROR_REASON,
+    }
@@ -5,16 +5,54 @@
 """
 
 import logging
-import uuid
-from typing import TYPE_CHECKING, Optional
+import os
+import random
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
 
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from pkg.tide_vllm.application.chat_handler import (
+    ChatCompletionRequest as DomainRequest,
+)
+from pkg.tide_vllm.provider import global_provider
+
 if TYPE_CHECKING:
     from pkg.tide_vllm.application import Application
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _ResponseClass = JSONResponse
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# SSE 流结束标记，与 OpenAI 流式接口一致
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# 请求ID只用于关联日志，不要求密码学安全：导入时取一次系统随机数作种子，
+# 之后不再逐请求调用 os.urandom
+_request_id_rng = random.Random(os.urandom(16))
+
+if hasattr(os, "register_at_fork"):
+    # 多 worker 进程 fork 后各自重新播种，避免生成相同的ID序列
+    os.register_at_fork(
+        after_in_child=lambda: _request_id_rng.seed(os.urandom(16))
+    )
+
+
+def _new_request_id() -> str:
+    """生成 32 位十六进制的请求ID"""
+    return "%032x" % _request_id_rng.getrandbits(128)
+
 
 # ========== 请求/响应模型 ==========
 
@@ -45,6 +83,32 @@ class HealthResponse(BaseModel):
     """健康检查响应"""
     status: str = Field(..., description="服务状态")
     vllm_healthy: bool = Field(..., description="vLLM服务是否健康")
+    response_cache: Optional[Dict[str, int]] = Field(
+        default=None, description="响应缓存统计（hits/misses/size/maxsize），未启用时为空"
+    )
+
+
+def _chat_response(
+    request_id: str,
+    content: str = "",
+    model: str = "",
+    usage: Optional[Dict[str, Any]] = None,
+    finish_reason: str = "",
+    error: Optional[str] = None,
+) -> JSONResponse:
+    """直接构造聊天补全响应
+
+    返回 Response 时 FastAPI 不再按 response_model 重新校验和序列化，
+    字段与 ChatCompletionResponse 保持一致
+    """
+    return _ResponseClass({
+        "request_id": request_id,
+        "content": content,
+        "model": model,
+        "usage": usage or {},
+        "finish_reason": finish_reason,
+        "error": error,
+    })
 
 
 # ========== 控制器 ==========
@@ -55,6 +119,8 @@ class ChatController:
     处理聊天相关的 HTTP 请求
     """
     
+    __slots__ = ("_app", "_chat_handler")
+    
     def __init__(self, app: "Application"):
         """初始化控制器
         
@@ -62,6 +128,8 @@ class ChatController:
             app: 应用层实例
         """
         self._app = app
+        # 处理器在应用组装后不再变化，构造时解析一次，请求路径直接调用
+        self._chat_handler = app.commands.chat_handler
     
     def register_routes(self, web_server):
         """注册路由到 Web 服务器
@@ -77,52 +145,51 @@ class ChatController:
                 raise AttributeError("web_server 必须有 'app' 或 'router' 属性")
             app = router
         
-        @app.get("/health")
-        async def health():
-            """健康检查端点
-            
-            curl http://localhost:10002/health
-            """
-            return await self.health()
-        
-        @app.post("/chat/completions")
-        async def chat_completions(request: ChatCompletionRequest):
-            """聊天补全端点
-            
-            使用千问3模型进行对话
-            
-            curl -X POST http://localhost:10002/chat/completions \
-              -H "Content-Type: application/json" \
-              -d '{
-                "prompt": "你好，请介绍一下你自己",
-                "system_prompt": "你是一个友好的AI助手",
-                "max_tokens": 512
-              }'
-            """
-            return await self.chat_completions(request)
-        
-        @app.post("/v1/chat/completions")
-        async def v1_chat_completions(request: ChatCompletionRequest):
-            """OpenAI 兼容的聊天补全端点
-            
-            与 /chat/completions 功能相同，提供 OpenAI 兼容的路径
-            """
-            return await self.chat_completions(request)
+        # 直接注册绑定方法，请求路径上不再多一层闭包调用
+        # 显式指定响应类，不依赖 Web 服务器的默认设置
+        app.add_api_route(
+            "/health", self.health, methods=["GET"], response_class=_ResponseClass
+        )
+        # response_model 仅用于 OpenAPI 文档，处理函数直接返回编码好的响应
+        app.add_api_route(
+            "/chat/completions",
+            self.chat_completions,
+            methods=["POST"],
+            response_model=ChatCompletionResponse,
+            response_class=_ResponseClass,
+        )
+        # 流式返回：边生成边发送，不在内存中缓冲完整响应
+        app.add_api_route(
+            "/chat/completions/stream",
+            self.chat_completions_stream,
+            methods=["POST"],
+        )
+        # OpenAI 兼容路径，与 /chat/completions 功能相同
+        app.add_api_route(
+            "/v1/chat/completions",
+            self.chat_completions,
+            methods=["POST"],
+            response_model=ChatCompletionResponse,
+            response_class=_ResponseClass,
+        )
     
     async def health(self) -> HealthResponse:
         """健康检查
         
+        curl http://localhost:10002/health
+        
         Returns:
             HealthResponse: 健康检查响应
         """
         try:
-            vllm_healthy = await self._app.commands.chat_handler.health_check()
+            vllm_healthy = await self._chat_handler.health_check()
             return HealthResponse(
                 status="healthy" if vllm_healthy else "degraded",
                 vllm_healthy=vllm_healthy,
+                response_cache=global_provider().response_cache_info(),
             )
         except Exception as e:
-            logger.error(f"健康检查失败: {e}")
+            logger.error("健康检查失败: %s", e)
             return HealthResponse(
                 status="unhealthy",
                 vllm_healthy=False,
@@ -130,23 +197,29 @@ class ChatController:
     
     async def chat_completions(
         self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse:
+    ) -> JSONResponse:
         """处理聊天补全请求
         
+        使用千问3模型进行对话
+        
+        curl -X POST http://localhost:10002/chat/completions \
+          -H "Content-Type: application/json" \
+          -d '{
+            "prompt": "你好，请介绍一下你自己",
+            "system_prompt": "你是一个友好的AI助手",
+            "max_tokens": 512
+          }'
+        
         Args:
             request: 聊天补全请求
             
         Returns:
-            ChatCompletionResponse: 聊天补全响应
+            JSONResponse: 聊天补全响应（字段同 ChatCompletionResponse）
         """
         # 生成请求ID
-        request_id = request.request_id or str(uuid.uuid4())
+        request_id = request.request_id or _new_request_id()
         
         try:
-            from pkg.tide_vllm.application.chat_handler import (
-                ChatCompletionRequest as DomainRequest,
-            )
-            
             # 转换为领域请求
             domain_request = DomainRequest(
                 request_id=request_id,
@@ -158,22 +231,66 @@ class ChatController:
             )
             
             # 调用处理器
-            domain_response = await self._app.commands.chat_handler.chat_completion(
-                domain_request
-            )
+            domain_response = await self._chat_handler.chat_completion(domain_request)
             
-            return ChatCompletionResponse(
-                request_id=domain_response.request_id,
+            return _chat_response(
+                domain_response.request_id,
                 content=domain_response.content,
                 model=domain_response.model,
-                usage=domain_response.usage or {},
+                usage=domain_response.usage,
                 finish_reason=domain_response.finish_reason,
             )
             
         except Exception as e:
-            logger.error(f"聊天补全请求失败: request_id={request_id}, error={e}")
-            return ChatCompletionResponse(
-                request_id=request_id,
-                content="",
-                error=str(e),
-            )
+            logger.error("聊天补全请求失败: request_id=%s, error=%s", request_id, e)
+            return _chat_response(request_id, error=str(e))
+    
+    async def chat_completions_stream(
+        self, request: ChatCompletionRequest
+    ) -> StreamingResponse:
+        """流式处理聊天补全请求
+        
+        以 text/event-stream 逐段返回生成内容，首字节延迟与生成开始时间一致
+        
+        curl -N -X POST http://localhost:10002/chat/completions/stream \
+          -H "Content-Type: application/json" \
+          -d '{"prompt": "你好，请介绍一下你自己"}'
+        
+        Args:
+            request: 聊天补全请求
+            
+        Returns:
+            StreamingResponse: 每个事件为 data: {"request_id", "content", "finish_reason"}，
+                出错时为 data: {"request_id", "error"}，以 data: [DONE] 结束
+        """
+        domain_request = DomainRequest(
+            request_id=request.request_id or _new_request_id(),
+            prompt=request.prompt,
+            system_prompt=request.system_prompt,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            top_p=request.top_p,
+        )
+        return StreamingResponse(
+            self._stream_events(domain_request),
+            media_type="text/event-stream",
+        )
+    
+    async def _stream_events(self, request: DomainRequest) -> AsyncIterator[bytes]:
+        """把处理器产出的片段编码为 SSE 事件"""
+        request_id = request.request_id
+        try:
+            async for chunk in self._chat_handler.chat_completion_stream(request):
+                yield b"data: " + _json_dumps({
+                    "request_id": request_id,
+                    "content": chunk.content,
+                    "finish_reason": chunk.finish_reason,
+                }) + b"\n\n"
+        except Exception as e:
+            # 响应头已发出，错误只能作为事件返回
+            logger.error("流式聊天补全请求失败: request_id=%s, error=%s", request_id, e)
+            yield b"data: " + _json_dumps({
+                "request_id": request_id,
+                "error": str(e),
+            }) + b"\n\n"
+        yield _SSE_DONE